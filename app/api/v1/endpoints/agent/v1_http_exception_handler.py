@@ -15,6 +15,9 @@
     500: "Internal Server Error",
 }
 
+# Path prefixes that use the legacy v1 {"error": ...} envelope
+_V1_ENVELOPE_PREFIXES = ("/api/v1/agent/", "/api/v1/client/")
+
 
 def _build_rfc9457_response(request: Request, exc: HTTPException) -> JSONResponse:
     """Build an RFC9457-compliant Problem Details response from an HTTPException."""
@@ -25,7 +28,7 @@ def _build_rfc9457_response(request: Request, exc: HTTPException) -> JSONRespons
         "type": "about:blank",
         "title": title,
         "status": exc.status_code,
-        "instance": str(request.url.path),
+        "instance": request.url.path,
     }
 
     # Support problem extensions when detail is a dictionary
@@ -63,9 +66,7 @@ async def v1_http_exception_handler(request: Request, exc: Exception) -> Respons
         return _build_rfc9457_response(request, exc)
 
     # Only handle if route is /api/v1/agent/* or /api/v1/client/*
-    if not request.url.path.startswith(
-        "/api/v1/agent/"
-    ) and not request.url.path.startswith("/api/v1/client/"):
+    if not request.url.path.startswith(_V1_ENVELOPE_PREFIXES):
         return await http_exception_handler(request, exc)
 
     if exc.status_code >= status.HTTP_400_BAD_REQUEST:
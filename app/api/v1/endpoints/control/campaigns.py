@@ -2,30 +2,59 @@
 Control API campaigns endpoints.
 
 The Control API uses API key authentication and offset-based pagination.
+The campaign list also supports keyset pagination through an opaque cursor,
+and conditional requests through ETag / If-None-Match.
 All responses are JSON format.
 Error responses must follow RFC9457 format.
 """
 
+import hashlib
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.control_exceptions import InternalServerError, ProjectAccessDeniedError
+from app.core.control_exceptions import (
+    InternalServerError,
+    InvalidPaginationCursorError,
+    ProjectAccessDeniedError,
+)
 from app.core.deps import get_current_control_user
 from app.core.services.campaign_service import list_campaigns_service
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.campaign import CampaignRead
-from app.schemas.shared import OffsetPaginatedResponse
+from app.schemas.shared import (
+    OffsetPaginatedResponse,
+    decode_keyset_cursor,
+    next_keyset_cursor,
+)
 
 router = APIRouter(prefix="/campaigns", tags=["Control - Campaigns"])
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 section 13.1.2)."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
 @router.get(
     "",
     summary="List campaigns",
-    description="List campaigns with offset-based pagination and filtering. Supports project scoping based on user permissions.",
+    description="List campaigns with offset- or cursor-based pagination and filtering. Supports project scoping based on user permissions. Responses carry an ETag; sending it back in If-None-Match returns 304 when the page is unchanged.",
+    response_model=OffsetPaginatedResponse[CampaignRead],
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The page matches the ETag sent in If-None-Match"
+        }
+    },
 )
 async def list_campaigns(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -34,6 +63,12 @@ async def list_campaigns(
         int, Query(ge=1, le=100, description="Number of items to return")
     ] = 10,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Cursor from a previous response's next_cursor; takes precedence over offset"
+        ),
+    ] = None,
     name: Annotated[
         str | None,
         Query(description="Filter campaigns by name (case-insensitive partial match)"),
@@ -41,15 +76,26 @@ async def list_campaigns(
     project_id: Annotated[
         int | None, Query(description="Filter campaigns by project ID")
     ] = None,
-) -> OffsetPaginatedResponse[CampaignRead]:
+    if_none_match: Annotated[
+        str | None, Header(description="ETag from a previous response")
+    ] = None,
+) -> Response:
     """
-    List campaigns with offset-based pagination and filtering.
+    List campaigns with offset- or cursor-based pagination and filtering.
 
     Access is scoped to projects the user has access to. If project_id is specified,
     the user must have access to that specific project.
 
+    Passing the previous page's ``next_cursor`` continues from the last campaign
+    seen instead of skipping ``offset`` rows, which keeps deep pages cheap.
+
     TODO: Implement API key authentication as specified in the Control API requirements.
     """
+    try:
+        after = decode_keyset_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise InvalidPaginationCursorError(detail=str(e)) from e
+
     try:
         # Get user's accessible projects - inline logic instead of importing control_access
         accessible_projects = (
@@ -74,6 +120,7 @@ async def list_campaigns(
                 limit=limit,
                 name_filter=name,
                 project_id=project_id,
+                after=after,
             )
         else:
             # Use multiple project_ids for filtering (much more efficient)
@@ -83,14 +130,29 @@ async def list_campaigns(
                 limit=limit,
                 name_filter=name,
                 project_ids=accessible_projects,
+                after=after,
             )
 
         # Convert to offset-based paginated response format
-        return OffsetPaginatedResponse(
+        page = OffsetPaginatedResponse(
             items=campaigns,
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_keyset_cursor(
+                campaigns, limit, after=after, offset=offset, total=total
+            ),
+        )
+
+        # Weak ETag: the body may still be re-encoded (e.g. gzip) downstream
+        body = page.model_dump_json().encode()
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if _etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
         )
     except ProjectAccessDeniedError:
         raise  # Re-raise project access errors
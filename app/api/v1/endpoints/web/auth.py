@@ -53,6 +53,12 @@
 PASSWORD_MIN_LENGTH = 10
 
 
+def _login_error(response: Response, status_code: int, message: str) -> LoginResult:
+    """Set the error status on the response and build the matching LoginResult."""
+    response.status_code = status_code
+    return LoginResult(message=message, level=LoginResultLevel.ERROR, access_token=None)
+
+
 @router.post(
     "/login",
     summary="Login (Web UI)",
@@ -85,20 +91,14 @@ async def login(
     user = await authenticate_user_service(email, password, db)
     if not user:
         logger.warning(f"Failed login attempt for email: {email}")
-        response.status_code = http_status.HTTP_400_BAD_REQUEST
-        return LoginResult(
-            message="Invalid email or password.",
-            level=LoginResultLevel.ERROR,
-            access_token=None,
+        return _login_error(
+            response, http_status.HTTP_400_BAD_REQUEST, "Invalid email or password."
         )
 
     if not user.is_active:
         logger.warning(f"Inactive user login attempt: {email}")
-        response.status_code = http_status.HTTP_403_FORBIDDEN
-        return LoginResult(
-            message="Account is inactive.",
-            level=LoginResultLevel.ERROR,
-            access_token=None,
+        return _login_error(
+            response, http_status.HTTP_403_FORBIDDEN, "Account is inactive."
         )
 
     token = create_access_token(user.id)
@@ -114,18 +114,17 @@ async def login(
         max_age=60 * 60,
     )
 
-    # Get user's projects to set default active project
-    result = await db.execute(
-        select(Project)
+    # Only the first project's ID is needed for the default active project
+    first_project_id = await db.scalar(
+        select(Project.id)
         .join(ProjectUserAssociation)
         .where(ProjectUserAssociation.user_id == user.id, Project.archived_at.is_(None))
         .order_by(Project.id)  # Use consistent ordering
+        .limit(1)
     )
-    projects = result.scalars().all()
 
     # Set active project cookie to first available project
-    if projects:
-        first_project_id = projects[0].id
+    if first_project_id is not None:
         response.set_cookie(
             key="active_project_id",
             value=str(first_project_id),
@@ -22,6 +22,7 @@
 from app.core.authz import user_can_access_project_by_id
 from app.core.deps import get_current_user
 from app.core.services.hash_list_service import (
+    HashListInUseError,
     HashListNotFoundError,
     HashListUpdateData,
     create_hash_list_service,
@@ -35,7 +36,11 @@
 from app.models.user import User
 from app.schemas.hash_item import HashItemOut
 from app.schemas.hash_list import HashListCreate, HashListOut
-from app.schemas.shared import PaginatedResponse
+from app.schemas.shared import (
+    PaginatedResponse,
+    decode_keyset_cursor,
+    next_keyset_cursor,
+)
 
 router = APIRouter(prefix="/hash_lists", tags=["Hash Lists"])
 
@@ -130,26 +135,49 @@ async def create_hash_list(
 @router.get(
     "/",
     summary="List hash lists",
-    description="List hash lists with pagination and filtering.",
+    description="List hash lists with page- or cursor-based pagination and filtering.",
 )
 async def list_hash_lists(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     size: Annotated[int, Query(ge=1, le=100, description="Page size")] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Cursor from a previous response's next_cursor; takes precedence over page"
+        ),
+    ] = None,
     name: Annotated[str | None, Query(description="Filter by name; optional")] = None,
     project_id: Annotated[
         int | None, Query(description="Filter by project ID; optional")
     ] = None,
 ) -> PaginatedResponse[HashListOut]:
-    """List hash lists with pagination and filtering."""
+    """
+    List hash lists with pagination and filtering.
+
+    Passing the previous page's ``next_cursor`` continues from the last hash list
+    seen instead of skipping whole pages, which keeps deep pages cheap.
+    """
+    try:
+        after = decode_keyset_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
     # If project_id is specified, check access
     if project_id is not None:
         await _check_user_has_access_to_project(project_id, "read", db, current_user)
 
     skip = (page - 1) * size
     hash_lists, total = await list_hash_lists_service(
-        db, skip=skip, limit=size, name_filter=name, project_id=project_id
+        db,
+        skip=skip,
+        limit=size,
+        name_filter=name,
+        project_id=project_id,
+        after=after,
     )
 
     return PaginatedResponse[HashListOut](
@@ -158,6 +186,9 @@ async def list_hash_lists(
         page=page,
         page_size=size,
         search=name,
+        next_cursor=next_keyset_cursor(
+            hash_lists, size, after=after, offset=skip, total=total
+        ),
     )
 
 
@@ -317,3 +348,5 @@ async def delete_hash_list(
         await delete_hash_list_service(hash_list_id, db)
     except HashListNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except HashListInUseError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
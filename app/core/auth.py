@@ -36,7 +36,7 @@ def hash_password(password: str) -> str:
         )
 
     # Use bcrypt directly
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
         DB_POOL_TIMEOUT: Seconds to wait for a connection from the pool
         DB_POOL_RECYCLE: Seconds after which connections are recycled
         DB_ECHO: Echo SQL statements to stdout (development only)
+        DB_POOL_PREWARM: Open DB_POOL_SIZE connections at startup
         sqlalchemy_database_uri: SQLAlchemy database URI (computed property)
         FIRST_SUPERUSER: First superuser email
         FIRST_SUPERUSER_PASSWORD: First superuser password
@@ -36,6 +37,7 @@ class Settings(BaseSettings):
         DEFAULT_WORKLOAD_PROFILE: Default hashcat workload profile
         ENABLE_ADDITIONAL_HASH_TYPES: Enable additional hash types
         ACCESS_TOKEN_EXPIRE_MINUTES: JWT access token expiration time in minutes
+        BCRYPT_ROUNDS: bcrypt cost factor (log2 rounds) for password hashing
         RESOURCE_EDIT_MAX_SIZE_MB: Maximum size (in MB) for in-browser resource editing
         RESOURCE_EDIT_MAX_LINES: Maximum number of lines for in-browser resource editing
         MINIO_ENDPOINT: MinIO S3-compatible storage endpoint
@@ -71,6 +73,12 @@ class Settings(BaseSettings):
         default=60,
         description="JWT access token expiration time in minutes",
     )
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=10,
+        le=31,
+        description="bcrypt cost factor (log2 rounds) for password hashing",
+    )
 
     # Database
     POSTGRES_SERVER: str = Field(
@@ -116,6 +124,10 @@ class Settings(BaseSettings):
         default=False,
         description="Echo SQL statements to stdout (development only)",
     )
+    DB_POOL_PREWARM: bool = Field(
+        default=True,
+        description="Open DB_POOL_SIZE connections at startup (more idle connections, faster first requests)",
+    )
 
     # Users
     FIRST_SUPERUSER: str = Field(
@@ -87,6 +87,12 @@ class InvalidResourceFormatError(BadRequestProblem):
     title = "Invalid Resource Format"
 
 
+class InvalidPaginationCursorError(BadRequestProblem):
+    """Invalid pagination cursor error."""
+
+    title = "Invalid Pagination Cursor"
+
+
 class InsufficientPermissionsError(ForbiddenProblem):
     """Insufficient permissions error."""
 
@@ -69,7 +69,7 @@ async def dispatch(
                 "title": exc.title,
                 "status": exc.status_code,
                 "detail": exc.detail,
-                "instance": str(request.url.path),
+                "instance": request.url.path,
                 # Extension fields - always present on InvalidStateTransitionProblem
                 "current_state": exc.current_state,
                 "attempted_state": exc.attempted_state,
@@ -109,7 +109,7 @@ async def dispatch(
                     "title": exc.title,
                     "status": exc.status_code,
                     "detail": exc.detail,
-                    "instance": str(request.url.path),
+                    "instance": request.url.path,
                 },
                 headers={"Content-Type": "application/problem+json"},
             )
@@ -122,7 +122,7 @@ async def dispatch(
                 "type": "about:blank",
                 "title": title,
                 "status": exc.status_code,
-                "instance": str(request.url.path),
+                "instance": request.url.path,
             }
 
             # Support problem extensions when detail is a dictionary
@@ -822,13 +822,18 @@ async def get_attack_service(
     db: AsyncSession,
 ) -> Attack:
     """
-    Fetch an Attack by ID, eagerly loading word_list. Raise AttackNotFoundError if not found.
+    Fetch an Attack by ID, eagerly loading the resource files serialized by AttackOut
+    (word_list, rule_list, mask_list). Raise AttackNotFoundError if not found.
     """
     from app.models.attack import Attack
 
     result = await db.execute(
         select(Attack)
-        .options(selectinload(Attack.word_list))
+        .options(
+            selectinload(Attack.word_list),
+            selectinload(Attack.rule_list),
+            selectinload(Attack.mask_list),
+        )
         .where(Attack.id == attack_id)
     )
     attack = result.scalar_one_or_none()
@@ -1,13 +1,15 @@
 from collections.abc import Sequence
+from datetime import datetime
 
 from fastapi import HTTPException
 from loguru import logger
 from sqlalchemy import Result, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.core.services.attack_complexity_service import calculate_attack_complexity
 from app.core.state_machines import CampaignStateMachine
+from app.db.pagination import fetch_newest_first_page
 from app.models.agent import Agent, AgentState
 from app.models.attack import Attack, AttackState
 from app.models.campaign import Campaign, CampaignState
@@ -55,10 +57,16 @@ async def list_campaigns_service(
     name_filter: str | None = None,
     project_id: int | None = None,
     project_ids: list[int] | None = None,
+    after: tuple[datetime, int] | None = None,
 ) -> tuple[list[CampaignRead], int]:
     """
     List campaigns, excluding unavailable campaigns and hash lists.
 
+    Campaigns are ordered newest first, with the ID as a tie-breaker. When
+    ``after`` is given, the page starts after that ``(created_at, id)`` position
+    (keyset pagination) and ``skip`` is ignored, so deep pages cost the same as
+    the first one.
+
     Args:
         db: AsyncSession
         skip: The number of campaigns to skip
@@ -66,6 +74,7 @@ async def list_campaigns_service(
         name_filter: A filter to apply to the campaign names
         project_id: The ID of the project to filter campaigns by (for compatibility)
         project_ids: List of project IDs to filter campaigns by (preferred over project_id)
+        after: Keyset position ``(created_at, id)`` of the last campaign already seen
 
     Returns:
         tuple[list[CampaignRead], int]: A tuple containing the list of campaigns and the total number of campaigns
@@ -87,11 +96,18 @@ async def list_campaigns_service(
 
     if name_filter:
         stmt = stmt.where(Campaign.name.ilike(f"%{name_filter}%"))
-    total = await db.execute(select(func.count()).select_from(stmt.subquery()))
-    total_count = total.scalar_one()
-    stmt = stmt.order_by(Campaign.created_at.desc()).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    campaigns = result.scalars().all()
+
+    # CampaignRead only reads columns; skip the mapped selectin load of
+    # attacks (and, through it, their tasks) for every listed campaign
+    campaigns, total_count = await fetch_newest_first_page(
+        db,
+        stmt,
+        Campaign,
+        skip=skip,
+        limit=limit,
+        after=after,
+        loader=lambda entity: lazyload(entity.attacks),
+    )
     return [
         CampaignRead.model_validate(c, from_attributes=True) for c in campaigns
     ], total_count
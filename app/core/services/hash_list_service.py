@@ -1,11 +1,14 @@
+from datetime import datetime
 from typing import Annotated
 
 from loguru import logger
 from pydantic import BaseModel, Field
-from sqlalchemy import func, or_, select
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.db.pagination import fetch_newest_first_page
+from app.models.campaign import Campaign
 from app.models.hash_item import HashItem
 from app.models.hash_list import HashList
 from app.models.user import User
@@ -32,6 +35,10 @@ class HashListNotFoundError(Exception):
     """Raised when a hash list is not found."""
 
 
+class HashListInUseError(Exception):
+    """Raised when a hash list is still referenced by a campaign."""
+
+
 async def create_hash_list_service(
     data: HashListCreate,
     db: AsyncSession,
@@ -81,16 +88,22 @@ async def list_hash_lists_service(
     limit: int = 20,
     name_filter: str | None = None,
     project_id: int | None = None,
+    after: tuple[datetime, int] | None = None,
 ) -> tuple[list[HashListOut], int]:
     """
     List hash lists with pagination and filtering.
 
+    Hash lists are ordered newest first, with the ID as a tie-breaker. When
+    ``after`` is given, the page starts after that ``(created_at, id)`` position
+    (keyset pagination) and ``skip`` is ignored.
+
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records to return
         name_filter: Optional name filter
         project_id: Optional project ID filter
+        after: Keyset position ``(created_at, id)`` of the last hash list already seen
 
     Returns:
         tuple[list[HashListOut], int]: List of hash lists and total count
@@ -100,22 +113,16 @@ async def list_hash_lists_service(
     if name_filter:
         stmt = stmt.where(HashList.name.ilike(f"%{name_filter}%"))
 
-    # Get total count
-    total_stmt = select(func.count()).select_from(stmt.subquery())
-    total_result = await db.execute(total_stmt)
-    total_count = total_result.scalar_one()
-
-    # Get paginated results with items loaded
-    stmt = (
-        stmt.options(selectinload(HashList.items))
-        .order_by(HashList.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+    hash_lists, total_count = await fetch_newest_first_page(
+        db,
+        stmt,
+        HashList,
+        skip=skip,
+        limit=limit,
+        after=after,
+        loader=lambda entity: selectinload(entity.items),
     )
 
-    result = await db.execute(stmt)
-    hash_lists = result.scalars().all()
-
     return [
         HashListOut.model_validate(hl, from_attributes=True) for hl in hash_lists
     ], total_count
@@ -275,6 +282,7 @@ async def delete_hash_list_service(hash_list_id: int, db: AsyncSession) -> None:
 
     Raises:
         HashListNotFoundError: If hash list is not found
+        HashListInUseError: If a campaign still uses the hash list
     """
     result = await db.execute(select(HashList).where(HashList.id == hash_list_id))
     hash_list = result.scalar_one_or_none()
@@ -282,6 +290,11 @@ async def delete_hash_list_service(hash_list_id: int, db: AsyncSession) -> None:
     if not hash_list:
         raise HashListNotFoundError(f"Hash list {hash_list_id} not found")
 
+    # Campaigns reference hash lists without ON DELETE, so refuse up front
+    # rather than failing on the foreign key at commit
+    if await db.scalar(select(exists().where(Campaign.hash_list_id == hash_list_id))):
+        raise HashListInUseError(f"Hash list {hash_list_id} is in use by a campaign")
+
     await db.delete(hash_list)
     await db.commit()
 
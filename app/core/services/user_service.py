@@ -7,6 +7,7 @@
 from sqlalchemy import func, or_, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.auth import hash_password, verify_password
 from app.models.project import Project, ProjectUserAssociation
@@ -46,7 +47,17 @@ async def list_users_service(db: AsyncSession) -> list[UserListItem]:
 async def authenticate_user_service(
     email: str, password: str, db: AsyncSession
 ) -> User | None:
-    result = await db.execute(select(User).where(User.email == email))
+    """Verify credentials and return the matching user, or None.
+
+    Only the columns the login flow reads are loaded; other attributes on the
+    returned user are unloaded and must be refreshed before use.
+    """
+    result = await db.execute(
+        select(User)
+        .options(load_only(User.id, User.email, User.hashed_password, User.is_active))
+        .where(User.email == email)
+        .limit(1)
+    )
     user = result.scalar_one_or_none()
     if not user or not verify_password(password, user.hashed_password):
         return None
@@ -0,0 +1,71 @@
+"""Shared paging for newest-first list queries."""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.base import ExecutableOption
+
+
+async def fetch_newest_first_page[M](
+    db: AsyncSession,
+    stmt: Select[tuple[M]],
+    entity: type[M],
+    *,
+    skip: int,
+    limit: int,
+    after: tuple[datetime, int] | None,
+    loader: Callable[[Any], ExecutableOption],
+) -> tuple[list[M], int]:
+    """Fetch one page of ``entity`` rows, newest first, and the filtered total.
+
+    Rows are ordered by ``(created_at, id)`` descending. When ``after`` is
+    given, the page starts after that position (keyset pagination) and
+    ``skip`` is ignored.
+
+    Args:
+        db: Database session
+        stmt: Filtered select of ``entity``
+        entity: Mapped class selected by ``stmt``; it must have ``created_at`` and ``id``
+        skip: Number of rows to skip on offset pages
+        limit: Maximum number of rows to return
+        after: Keyset position ``(created_at, id)`` of the last row already seen
+        loader: Builds the relationship loader option for the given entity or alias
+
+    Returns:
+        tuple[list[M], int]: The page rows and the total number of matching rows
+    """
+    count_stmt = select(func.count()).select_from(stmt.subquery())
+    model: Any = entity
+
+    if after is not None:
+        # Keyset pages query the table directly so the (created_at, id)
+        # predicate and LIMIT can stop early; Postgres cannot push them below
+        # a window function, which would sort the whole filtered set first
+        page_stmt = (
+            stmt.options(loader(model))
+            .where(tuple_(model.created_at, model.id) < tuple_(*after))
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+        )
+        items = list((await db.execute(page_stmt)).scalars().all())
+        return items, (await db.execute(count_stmt)).scalar_one()
+
+    # Count the filtered set with a window function so the total comes back
+    # with the page rows in one round trip
+    windowed = stmt.add_columns(func.count().over().label("total")).subquery()
+    page: Any = aliased(entity, windowed)
+    page_stmt = (
+        select(page, windowed.c.total)
+        .options(loader(page))
+        .order_by(page.created_at.desc(), page.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = (await db.execute(page_stmt)).all()
+    # Past the last page there is no row to carry the total
+    total = rows[0].total if rows else (await db.execute(count_stmt)).scalar_one()
+    return [row[0] for row in rows], total
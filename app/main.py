@@ -61,6 +61,13 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     # Initialize database session manager with consolidated settings
     sessionmanager.init(settings)
 
+    # Warm the connection pool in the background so startup is not blocked
+    prewarm_task = (
+        asyncio.create_task(sessionmanager.prewarm(settings.DB_POOL_SIZE))
+        if settings.DB_POOL_PREWARM
+        else None
+    )
+
     # Start periodic cleanup task
     cleanup_task = asyncio.create_task(run_periodic_cleanup())
 
@@ -70,6 +77,10 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     cleanup_task.cancel()
     with suppress(asyncio.CancelledError):
         await cleanup_task
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await prewarm_task
     await sessionmanager.close()
 
 
@@ -1,5 +1,7 @@
+import base64
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, Protocol
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -7,6 +9,57 @@
 from app.models.attack import AttackMode
 
 
+def encode_keyset_cursor(created_at: datetime, item_id: int) -> str:
+    """Encode a ``(created_at, id)`` keyset position as an opaque pagination cursor."""
+    raw = f"{created_at.isoformat()}|{item_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_keyset_cursor.
+
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+    try:
+        created_at, item_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        )
+        return datetime.fromisoformat(created_at), int(item_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+class KeysetItem(Protocol):
+    """An item that can be paged by its ``(created_at, id)`` position."""
+
+    @property
+    def created_at(self) -> datetime: ...
+
+    @property
+    def id(self) -> int: ...
+
+
+def next_keyset_cursor(
+    items: Sequence[KeysetItem],
+    limit: int,
+    *,
+    after: tuple[datetime, int] | None,
+    offset: int,
+    total: int,
+) -> str | None:
+    """
+    Return the cursor for the page after ``items``, or None on the last page.
+
+    A full page may have more behind it; offset pages can check the total.
+    """
+    has_more = len(items) == limit and (after is not None or offset + limit < total)
+    if not has_more:
+        return None
+    return encode_keyset_cursor(items[-1].created_at, items[-1].id)
+
+
 class PaginatedResponse[T](BaseModel):
     """Generic response model for paginated results used by Web UI API."""
 
@@ -47,6 +100,13 @@ class PaginatedResponse[T](BaseModel):
             examples=[None, "password", "admin"],
         ),
     ] = None
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Opaque cursor for the next page on endpoints that support keyset pagination; null when there are no more items.",
+            examples=[None, "MjAyNC0wMS0wMVQxMjowMDowMCswMDowMHw0Mg=="],
+        ),
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -99,6 +159,13 @@ class OffsetPaginatedResponse[T](BaseModel):
             examples=[0, 20, 100],
         ),
     ]
+    next_cursor: Annotated[
+        str | None,
+        Field(
+            description="Opaque cursor for the next page on endpoints that support keyset pagination; null when there are no more items.",
+            examples=[None, "MjAyNC0wMS0wMVQxMjowMDowMCswMDowMHw0Mg=="],
+        ),
+    ] = None
 
     model_config = ConfigDict(
         json_schema_extra={
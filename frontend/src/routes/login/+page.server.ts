@@ -56,7 +56,7 @@ export const actions: Actions = {
 
             // Determine redirect destination
             const redirectTo = url.searchParams.get('redirectTo') || '/';
-            throw redirect(302, redirectTo);
+            throw redirect(303, redirectTo);
         }
 
         try {
@@ -87,7 +87,7 @@ export const actions: Actions = {
 
                     // Determine redirect destination
                     const redirectTo = url.searchParams.get('redirectTo') || '/';
-                    throw redirect(302, redirectTo);
+                    throw redirect(303, redirectTo);
                 } else {
                     return message(form, {
                         type: 'error',
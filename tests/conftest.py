@@ -6,7 +6,6 @@
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
-import bcrypt
 import pytest
 import pytest_asyncio
 
@@ -15,6 +14,7 @@
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 from httpx import ASGITransport, AsyncClient
 from minio import Minio
+from sqlalchemy import Engine, create_engine, make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -27,6 +27,7 @@
 from app.core.auth import create_access_token
 from app.core.config import Settings, settings
 from app.core.deps import get_db
+from app.db.session import DatabaseSessionManager
 from app.main import app
 from app.models.agent import Agent
 from app.models.base import Base
@@ -55,12 +56,61 @@
 # Test DB provisioning
 @pytest.fixture(scope="session")
 def pg_container_url() -> Generator[str]:
-    """Start a Postgres test container and yield a psycopg connection string."""
-    with PostgresContainer("postgres:16", driver="psycopg") as postgres:
+    """Start a Postgres test container and yield a psycopg connection string.
+
+    The data directory lives on tmpfs and durability is switched off: the
+    database is thrown away after the run, so commits need not reach disk.
+    """
+    container = (
+        PostgresContainer("postgres:16", driver="psycopg")
+        .with_command(
+            "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+        )
+        .with_kwargs(tmpfs={"/var/lib/postgresql/data": "rw"})
+    )
+    with container as postgres:
         url = postgres.get_connection_url()
         yield url
 
 
+TEMPLATE_DB = "ouroboros_template"
+
+
+@pytest.fixture(scope="session")
+def pg_admin_engine(pg_container_url: str) -> Generator[Engine]:
+    """Autocommit engine on the maintenance database, for CREATE/DROP DATABASE."""
+    engine = create_engine(
+        make_url(pg_container_url).set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def pg_template_db(pg_container_url: str, pg_admin_engine: Engine) -> str:
+    """Create the schema and seed hash types once, in a template database.
+
+    Each test then gets its database as a copy of this template (see
+    ``async_engine``), which is much cheaper than rebuilding the schema and
+    re-seeding for every test.
+    """
+    from app.core.services.hash_type_service import HashTypeService
+
+    with pg_admin_engine.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{TEMPLATE_DB}"'))
+
+    engine = create_async_engine(make_url(pg_container_url).set(database=TEMPLATE_DB))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        # Limit to the first 50 hash types for test performance
+        await HashTypeService.seed_hash_types_from_json(session, limit=50)
+    # CREATE DATABASE ... TEMPLATE fails while the template has open connections
+    await engine.dispose()
+    return TEMPLATE_DB
+
+
 @pytest.fixture
 def sync_db_url(pg_container_url: str) -> str:
     return pg_container_url
@@ -72,11 +122,18 @@ def db_url(pg_container_url: str) -> str:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def async_engine(db_url: str) -> AsyncGenerator[AsyncEngine]:
-    engine = create_async_engine(db_url, future=True)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+async def async_engine(
+    db_url: str, pg_admin_engine: Engine, pg_template_db: str
+) -> AsyncGenerator[AsyncEngine]:
+    # Recreate the test database from the template; FORCE closes any
+    # connections a previous test left behind
+    database = make_url(db_url).database
+    with pg_admin_engine.connect() as conn:
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{database}" WITH (FORCE)'))
+        conn.execute(text(f'CREATE DATABASE "{database}" TEMPLATE "{pg_template_db}"'))
+
+    # LIFO keeps reusing the most recently returned (already warm) connection
+    engine = create_async_engine(db_url, future=True, pool_use_lifo=True)
     yield engine
     await engine.dispose()
 
@@ -122,15 +179,13 @@ async def db_session(async_engine: Any) -> AsyncGenerator[AsyncSession, Any]:
 
 
 @pytest_asyncio.fixture(autouse=True)
-async def reset_db_and_seed_hash_types(db_session: AsyncSession) -> None:
-    # Truncate all tables
-    for table in reversed(Base.metadata.sorted_tables):
-        await db_session.execute(table.delete())
-
-    # Seed hash types from JSON file (limit to first 50 for test performance)
-    from app.core.services.hash_type_service import HashTypeService
+async def bind_factories_to_session(db_session: AsyncSession) -> None:
+    """Open ``db_session`` for every test so the factories are bound to it.
 
-    await HashTypeService.seed_hash_types_from_json(db_session, limit=50)
+    Requesting the session also clones the test database from the seeded
+    template (see ``async_engine``), so tests that only use factories still
+    start from a fresh database.
+    """
 
 
 @pytest.fixture
@@ -155,6 +210,21 @@ def db_settings(db_url: str) -> Settings:
     )
 
 
+@pytest_asyncio.fixture
+async def session_manager(
+    db_settings: Settings,
+) -> AsyncGenerator[DatabaseSessionManager]:
+    """Yield an initialized DatabaseSessionManager and dispose its pool afterwards.
+
+    Engines are bound to the event loop they first connect on, so the manager is
+    scoped to the test rather than shared across the session.
+    """
+    manager = DatabaseSessionManager()
+    manager.init(db_settings)
+    yield manager
+    await manager.close()
+
+
 @pytest_asyncio.fixture
 async def async_client(
     db_session: AsyncSession, db_settings: Settings
@@ -285,9 +355,6 @@ async def authenticated_async_client(
 ) -> AsyncGenerator[AsyncClient]:
     """Yield an authenticated async_client with a valid user session for most tests."""
     user = await UserFactory.create_async()
-    user.hashed_password = bcrypt.hashpw(b"password", bcrypt.gensalt()).decode()
-    db_session.add(user)
-    await db_session.commit()
     token = create_access_token(user.id)
     async_client.cookies.set("access_token", token)
     yield async_client
@@ -299,9 +366,6 @@ async def authenticated_user_client(
 ) -> AsyncGenerator[tuple[AsyncClient, User]]:
     """Yield (async_client, user) for tests that need the user object for project membership, etc."""
     user = await UserFactory.create_async()
-    user.hashed_password = bcrypt.hashpw(b"password", bcrypt.gensalt()).decode()
-    db_session.add(user)
-    await db_session.commit()
     token = create_access_token(user.id)
     async_client.cookies.set("access_token", token)
     yield async_client, user
@@ -313,9 +377,6 @@ async def authenticated_admin_client(
 ) -> AsyncGenerator[AsyncClient]:
     """Yield an authenticated async_client with a valid admin user session for admin-only tests."""
     user = await UserFactory.create_async(role=UserRole.ADMIN, is_superuser=True)
-    user.hashed_password = bcrypt.hashpw(b"password", bcrypt.gensalt()).decode()
-    db_session.add(user)
-    await db_session.commit()
     token = create_access_token(user.id)
     async_client.cookies.set("access_token", token)
     yield async_client
@@ -327,28 +388,21 @@ async def api_key_client(
 ) -> AsyncGenerator[tuple[AsyncClient, User, str]]:
     """
     Create a user with API key and return (client, user, api_key).
-    """
-    from sqlalchemy import select
-
-    from app.core.services.user_service import create_user_service
-    from app.schemas.user import UserCreate
 
-    # Create user using the service to ensure API key is generated
-    user_data = UserCreate(
-        email="apitest@example.com", name="API Test User", password="testpassword123"
-    )
-
-    user_read = await create_user_service(
-        db=db_session, user_in=user_data, role=UserRole.ANALYST
+    The client sends the user's API key in the Authorization header by default.
+    """
+    # The factory stores a precomputed password hash and a cst_ API key, so
+    # this is a single INSERT rather than a bcrypt hash plus several commits
+    user = await UserFactory.create_async(
+        email="apitest@example.com", name="API Test User", role=UserRole.ANALYST
     )
 
-    # Fetch the actual user from database to get API key
-    result = await db_session.execute(select(User).where(User.id == user_read.id))
-    user = result.scalar_one()
-
     # Ensure API key is not None
     assert user.api_key is not None, "API key should be generated"
 
+    # Authenticate every request by default; tests can still override per request
+    async_client.headers["Authorization"] = f"Bearer {user.api_key}"
+
     yield async_client, user, user.api_key
 
 
@@ -390,3 +444,10 @@ def minio_client(minio_container: MinioContainer) -> Minio:
 @pytest.fixture(autouse=True, scope="session")
 def fast_resource_upload_timeout() -> None:
     settings.RESOURCE_UPLOAD_TIMEOUT_SECONDS = 2
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hashing() -> None:
+    # bcrypt's minimum cost; the default of 12 costs ~250ms per hash. Settings
+    # do not validate assignment, so this bypasses the production floor of 10
+    settings.BCRYPT_ROUNDS = 4
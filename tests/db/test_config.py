@@ -1,8 +1,5 @@
 """Tests for consolidated database configuration in Settings."""
 
-import os
-from collections.abc import Generator
-
 import pytest
 from pydantic import ValidationError
 
@@ -14,15 +11,22 @@
 DEFAULT_POOL_TIMEOUT = 30
 DEFAULT_POOL_RECYCLE = 1800
 
+# Environment variables that would override the settings under test
+DB_ENV_VARS = (
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "DB_POOL_TIMEOUT",
+    "DB_POOL_RECYCLE",
+    "DB_ECHO",
+    "DB_POOL_PREWARM",
+)
+
 
 @pytest.fixture(autouse=True)
-def clean_env() -> Generator[None]:
-    """Clean environment variables before each test."""
-    old_environ = dict(os.environ)
-    os.environ.clear()
-    yield
-    os.environ.clear()
-    os.environ.update(old_environ)
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unset the database settings variables before each test."""
+    for name in DB_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
 
 
 def test_settings_database_uri_construction() -> None:
@@ -101,6 +105,7 @@ def test_settings_db_defaults() -> None:
     assert settings.DB_POOL_TIMEOUT == DEFAULT_POOL_TIMEOUT
     assert settings.DB_POOL_RECYCLE == DEFAULT_POOL_RECYCLE
     assert settings.DB_ECHO is False
+    assert settings.DB_POOL_PREWARM is True
 
 
 def test_settings_db_echo() -> None:
@@ -112,13 +117,13 @@ def test_settings_db_echo() -> None:
     assert settings.DB_ECHO is False
 
 
-def test_settings_from_environment() -> None:
+def test_settings_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that settings can be loaded from environment variables."""
-    os.environ["DB_POOL_SIZE"] = "10"
-    os.environ["DB_MAX_OVERFLOW"] = "20"
-    os.environ["DB_POOL_TIMEOUT"] = "60"
-    os.environ["DB_POOL_RECYCLE"] = "3600"
-    os.environ["DB_ECHO"] = "true"
+    monkeypatch.setenv("DB_POOL_SIZE", "10")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "20")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "60")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "3600")
+    monkeypatch.setenv("DB_ECHO", "true")
 
     settings = Settings()
     assert settings.DB_POOL_SIZE == 10
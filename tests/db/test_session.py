@@ -11,12 +11,11 @@
 
 
 @pytest.mark.asyncio
-async def test_session_manager_initialization(db_settings: Settings) -> None:
+async def test_session_manager_initialization(
+    session_manager: DatabaseSessionManager,
+) -> None:
     """Test session manager initialization."""
-    manager = DatabaseSessionManager()
-    manager.init(db_settings)
-
-    assert manager.engine is not None
+    assert session_manager.engine is not None
 
 
 @pytest.mark.asyncio
@@ -51,12 +50,11 @@ async def test_session_manager_close(db_settings: Settings) -> None:
 
 
 @pytest.mark.asyncio
-async def test_session_context_manager(db_settings: Settings) -> None:
+async def test_session_context_manager(
+    session_manager: DatabaseSessionManager,
+) -> None:
     """Test session context manager functionality."""
-    manager = DatabaseSessionManager()
-    manager.init(db_settings)
-
-    async with manager.session() as session:
+    async with session_manager.session() as session:
         assert isinstance(session, AsyncSession)
         # Test that session is active
         result = await session.execute(text("SELECT 1"))
@@ -64,6 +62,16 @@ async def test_session_context_manager(db_settings: Settings) -> None:
         assert value == 1  # 1 is the expected session count in this test
 
 
+@pytest.mark.asyncio
+async def test_session_manager_prewarm(
+    session_manager: DatabaseSessionManager,
+) -> None:
+    """Test that prewarm leaves the opened connections idle in the pool."""
+    await session_manager.prewarm(2)
+
+    assert session_manager.engine.pool.checkedin() == 2
+
+
 async def _raise_and_rollback(manager: DatabaseSessionManager) -> None:
     async with manager.session() as session:
         result = await session.execute(text("SELECT 1"))
@@ -73,13 +81,12 @@ async def _raise_and_rollback(manager: DatabaseSessionManager) -> None:
 
 
 @pytest.mark.asyncio
-async def test_session_rollback_on_error(db_settings: Settings) -> None:
+async def test_session_rollback_on_error(
+    session_manager: DatabaseSessionManager,
+) -> None:
     """Test session rollback on error."""
-    manager = DatabaseSessionManager()
-    manager.init(db_settings)
-
     with pytest.raises(ValueError):
-        await _raise_and_rollback(manager)
+        await _raise_and_rollback(session_manager)
 
 
 @pytest.mark.asyncio
@@ -100,3 +107,4 @@ async def test_get_session_dependency(db_settings: Settings) -> None:
     # Clean up
     with contextlib.suppress(Exception):
         await session.close()
+    await db_session_module.sessionmanager.close()
@@ -1,15 +1,19 @@
 import secrets
 from datetime import UTC, datetime
 
+import bcrypt
 from faker import Faker
 from polyfactory import Use
 from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
 
-from app.core.auth import hash_password
 from app.models.user import User, UserRole
 
 fake = Faker()
 
+# bcrypt is deliberately slow, so hash the shared test password once per process
+# at the minimum cost; verification cost follows the cost stored in the hash
+PASSWORD_HASH = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode()
+
 
 class UserFactory(SQLAlchemyFactory[User]):
     __model__ = User
@@ -31,8 +35,7 @@ def email(cls) -> str:
         return f"user{cls._email_counter}-{cls.__faker__.uuid4()}@example.com"
 
     # Always use a valid bcrypt hash for 'password'
-    # Use a lambda to generate hash at runtime to avoid class definition issues
-    hashed_password = Use(lambda: hash_password("password"))
+    hashed_password = PASSWORD_HASH
     is_active = True
     role = UserRole.ANALYST
     is_superuser = False
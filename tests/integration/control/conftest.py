@@ -1,8 +1,12 @@
 import uuid
 
 import pytest_asyncio
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
+from app.models.user import User
+from tests.factories.project_factory import ProjectFactory
 from tests.utils.test_helpers import create_user_with_api_key_and_project_access
 
 
@@ -14,3 +18,21 @@ async def api_user_with_project(
         db_session, user_name="Test User", project_name="Test Project"
     )
     return user_id, project_id, api_key
+
+
+@pytest_asyncio.fixture
+async def authorized_project(
+    api_key_client: tuple[AsyncClient, User, str],
+    project_factory: ProjectFactory,
+    db_session: AsyncSession,
+) -> Project:
+    """Create a project the api_key_client user is a member of."""
+    _, user, _ = api_key_client
+    project = await project_factory.create_async()
+    db_session.add(
+        ProjectUserAssociation(
+            project_id=project.id, user_id=user.id, role=ProjectUserRole.member
+        )
+    )
+    await db_session.flush()
+    return project
@@ -12,48 +12,36 @@
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.project import ProjectUserAssociation, ProjectUserRole
+from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
 from app.models.user import User
 from tests.factories.campaign_factory import CampaignFactory
 from tests.factories.hash_list_factory import HashListFactory
 from tests.factories.project_factory import ProjectFactory
+from tests.utils.test_helpers import create_batch
 
 
 @pytest.mark.asyncio
 async def test_list_campaigns_happy_path(
     api_key_client: tuple[AsyncClient, User, str],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
     db_session: AsyncSession,
+    authorized_project: Project,
+    hash_list_factory: HashListFactory,
 ) -> None:
     """Test basic campaign listing with default pagination."""
-    async_client, user, api_key = api_key_client
-
-    # Create project and associate user
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
+    async_client, _user, _api_key = api_key_client
 
     # Create hash list and campaigns
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    await campaign_factory.create_async(
-        name="Campaign Alpha",
-        project_id=project.id,
-        hash_list_id=hash_list.id,
-    )
-    await campaign_factory.create_async(
-        name="Campaign Beta",
-        project_id=project.id,
+    hash_list = await hash_list_factory.create_async(project_id=authorized_project.id)
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": "Campaign Alpha"}, {"name": "Campaign Beta"}],
+        project_id=authorized_project.id,
         hash_list_id=hash_list.id,
     )
 
     # Test the endpoint with API key authentication
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get("/api/v1/control/campaigns", headers=headers)
+    resp = await async_client.get("/api/v1/control/campaigns")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -75,38 +63,25 @@ async def test_list_campaigns_happy_path(
 @pytest.mark.asyncio
 async def test_list_campaigns_pagination(
     api_key_client: tuple[AsyncClient, User, str],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
     db_session: AsyncSession,
+    authorized_project: Project,
+    hash_list_factory: HashListFactory,
 ) -> None:
     """Test offset-based pagination."""
-    async_client, user, api_key = api_key_client
-
-    # Create project and associate user
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
+    async_client, _user, _api_key = api_key_client
 
     # Create hash list and multiple campaigns
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaigns = []
-    for i in range(5):
-        campaign = await campaign_factory.create_async(
-            name=f"Campaign {i:02d}",
-            project_id=project.id,
-            hash_list_id=hash_list.id,
-        )
-        campaigns.append(campaign)
+    hash_list = await hash_list_factory.create_async(project_id=authorized_project.id)
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": f"Campaign {i:02d}"} for i in range(5)],
+        project_id=authorized_project.id,
+        hash_list_id=hash_list.id,
+    )
 
     # Test first page
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?limit=2&offset=0", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?limit=2&offset=0")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -116,9 +91,7 @@ async def test_list_campaigns_pagination(
     assert len(data["items"]) == 2
 
     # Test second page
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?limit=2&offset=2", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?limit=2&offset=2")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -128,9 +101,7 @@ async def test_list_campaigns_pagination(
     assert len(data["items"]) == 2
 
     # Test last page
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?limit=2&offset=4", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?limit=2&offset=4")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -138,50 +109,123 @@ async def test_list_campaigns_pagination(
     assert data["limit"] == 2
     assert data["offset"] == 4
     assert len(data["items"]) == 1
+    assert data["next_cursor"] is None
 
 
 @pytest.mark.asyncio
-async def test_list_campaigns_name_filter(
+async def test_list_campaigns_cursor_pagination(
     api_key_client: tuple[AsyncClient, User, str],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
     db_session: AsyncSession,
+    authorized_project: Project,
+    hash_list_factory: HashListFactory,
 ) -> None:
-    """Test filtering campaigns by name."""
-    async_client, user, api_key = api_key_client
-
-    # Create project and associate user
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
+    """Test that next_cursor walks every campaign exactly once."""
+    async_client, _user, _api_key = api_key_client
+
+    hash_list = await hash_list_factory.create_async(project_id=authorized_project.id)
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": f"Campaign {i:02d}"} for i in range(5)],
+        project_id=authorized_project.id,
+        hash_list_id=hash_list.id,
     )
-    db_session.add(assoc)
-    await db_session.commit()
 
-    # Create hash list and campaigns
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    await campaign_factory.create_async(
-        name="Alpha Campaign",
-        project_id=project.id,
+    seen: list[str] = []
+    url = "/api/v1/control/campaigns?limit=2"
+    while True:
+        resp = await async_client.get(url)
+        assert resp.status_code == HTTPStatus.OK
+        data = resp.json()
+        assert data["total"] == 5
+        seen.extend(item["name"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        url = f"/api/v1/control/campaigns?limit=2&cursor={data['next_cursor']}"
+
+    assert sorted(seen) == [f"Campaign {i:02d}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_list_campaigns_etag_not_modified(
+    api_key_client: tuple[AsyncClient, User, str],
+    db_session: AsyncSession,
+    authorized_project: Project,
+    hash_list_factory: HashListFactory,
+) -> None:
+    """Test that a matching If-None-Match returns 304 until the page changes."""
+    async_client, _user, _api_key = api_key_client
+
+    hash_list = await hash_list_factory.create_async(project_id=authorized_project.id)
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": "Campaign Alpha"}],
+        project_id=authorized_project.id,
         hash_list_id=hash_list.id,
     )
-    await campaign_factory.create_async(
-        name="Beta Campaign",
-        project_id=project.id,
+
+    resp = await async_client.get("/api/v1/control/campaigns")
+    assert resp.status_code == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await async_client.get(
+        "/api/v1/control/campaigns", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+
+    # A new campaign changes the page, so the old ETag no longer matches
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": "Campaign Beta"}],
+        project_id=authorized_project.id,
         hash_list_id=hash_list.id,
     )
-    await campaign_factory.create_async(
-        name="Alpha Test",
-        project_id=project.id,
+    resp = await async_client.get(
+        "/api/v1/control/campaigns", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+    assert resp.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_list_campaigns_invalid_cursor(
+    api_key_client: tuple[AsyncClient, User, str],
+) -> None:
+    """Test that a malformed cursor is rejected with a 400 problem response."""
+    async_client, _user, _api_key = api_key_client
+
+    resp = await async_client.get("/api/v1/control/campaigns?cursor=not-a-cursor")
+    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    assert resp.json()["title"] == "Invalid Pagination Cursor"
+
+
+@pytest.mark.asyncio
+async def test_list_campaigns_name_filter(
+    api_key_client: tuple[AsyncClient, User, str],
+    db_session: AsyncSession,
+    authorized_project: Project,
+    hash_list_factory: HashListFactory,
+) -> None:
+    """Test filtering campaigns by name."""
+    async_client, _user, _api_key = api_key_client
+
+    # Create hash list and campaigns
+    hash_list = await hash_list_factory.create_async(project_id=authorized_project.id)
+    await create_batch(
+        db_session,
+        CampaignFactory,
+        [{"name": "Alpha Campaign"}, {"name": "Beta Campaign"}, {"name": "Alpha Test"}],
+        project_id=authorized_project.id,
         hash_list_id=hash_list.id,
     )
 
     # Test name filter
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?name=Alpha", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?name=Alpha")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -201,37 +245,42 @@ async def test_list_campaigns_project_scoping(
     db_session: AsyncSession,
 ) -> None:
     """Test that campaigns are properly scoped to user's projects."""
-    async_client, user, api_key = api_key_client
+    async_client, user, _api_key = api_key_client
 
     # Create two projects
-    project1 = await project_factory.create_async()
-    project2 = await project_factory.create_async()
+    project1, project2 = await project_factory.create_batch_async(2)
 
     # Associate user only with project1
     assoc = ProjectUserAssociation(
         project_id=project1.id, user_id=user.id, role=ProjectUserRole.member
     )
     db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash lists and campaigns in both projects
-    hash_list1 = await hash_list_factory.create_async(project_id=project1.id)
-    hash_list2 = await hash_list_factory.create_async(project_id=project2.id)
-
-    await campaign_factory.create_async(
-        name="Accessible Campaign",
-        project_id=project1.id,
-        hash_list_id=hash_list1.id,
-    )
-    await campaign_factory.create_async(
-        name="Inaccessible Campaign",
-        project_id=project2.id,
-        hash_list_id=hash_list2.id,
+    await db_session.flush()
+
+    # Create hash lists and campaigns in both projects, one INSERT per table
+    hash_list1 = hash_list_factory.build(project_id=project1.id)
+    hash_list2 = hash_list_factory.build(project_id=project2.id)
+    db_session.add_all([hash_list1, hash_list2])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            campaign_factory.build(
+                name="Accessible Campaign",
+                project_id=project1.id,
+                hash_list_id=hash_list1.id,
+            ),
+            campaign_factory.build(
+                name="Inaccessible Campaign",
+                project_id=project2.id,
+                hash_list_id=hash_list2.id,
+            ),
+        ]
     )
+    await db_session.flush()
 
     # Test that only campaigns from accessible project are returned
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get("/api/v1/control/campaigns", headers=headers)
+    resp = await async_client.get("/api/v1/control/campaigns")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -249,11 +298,10 @@ async def test_list_campaigns_specific_project_filter(
     db_session: AsyncSession,
 ) -> None:
     """Test filtering campaigns by specific project ID."""
-    async_client, user, api_key = api_key_client
+    async_client, user, _api_key = api_key_client
 
     # Create two projects and associate user with both
-    project1 = await project_factory.create_async()
-    project2 = await project_factory.create_async()
+    project1, project2 = await project_factory.create_batch_async(2)
 
     assoc1 = ProjectUserAssociation(
         project_id=project1.id, user_id=user.id, role=ProjectUserRole.member
@@ -262,28 +310,32 @@ async def test_list_campaigns_specific_project_filter(
         project_id=project2.id, user_id=user.id, role=ProjectUserRole.member
     )
     db_session.add_all([assoc1, assoc2])
-    await db_session.commit()
-
-    # Create hash lists and campaigns in both projects
-    hash_list1 = await hash_list_factory.create_async(project_id=project1.id)
-    hash_list2 = await hash_list_factory.create_async(project_id=project2.id)
-
-    await campaign_factory.create_async(
-        name="Project 1 Campaign",
-        project_id=project1.id,
-        hash_list_id=hash_list1.id,
-    )
-    await campaign_factory.create_async(
-        name="Project 2 Campaign",
-        project_id=project2.id,
-        hash_list_id=hash_list2.id,
+    await db_session.flush()
+
+    # Create hash lists and campaigns in both projects, one INSERT per table
+    hash_list1 = hash_list_factory.build(project_id=project1.id)
+    hash_list2 = hash_list_factory.build(project_id=project2.id)
+    db_session.add_all([hash_list1, hash_list2])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            campaign_factory.build(
+                name="Project 1 Campaign",
+                project_id=project1.id,
+                hash_list_id=hash_list1.id,
+            ),
+            campaign_factory.build(
+                name="Project 2 Campaign",
+                project_id=project2.id,
+                hash_list_id=hash_list2.id,
+            ),
+        ]
     )
+    await db_session.flush()
 
     # Test filtering by project1
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        f"/api/v1/control/campaigns?project_id={project1.id}", headers=headers
-    )
+    resp = await async_client.get(f"/api/v1/control/campaigns?project_id={project1.id}")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -292,9 +344,7 @@ async def test_list_campaigns_specific_project_filter(
     assert data["items"][0]["name"] == "Project 1 Campaign"
 
     # Test filtering by project2
-    resp = await async_client.get(
-        f"/api/v1/control/campaigns?project_id={project2.id}", headers=headers
-    )
+    resp = await async_client.get(f"/api/v1/control/campaigns?project_id={project2.id}")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -312,23 +362,19 @@ async def test_list_campaigns_unauthorized_project(
     db_session: AsyncSession,
 ) -> None:
     """Test that accessing unauthorized project returns 403."""
-    async_client, user, api_key = api_key_client
+    async_client, user, _api_key = api_key_client
 
     # Create two projects, associate user only with project1
-    project1 = await project_factory.create_async()
-    project2 = await project_factory.create_async()
+    project1, project2 = await project_factory.create_batch_async(2)
 
     assoc = ProjectUserAssociation(
         project_id=project1.id, user_id=user.id, role=ProjectUserRole.member
     )
     db_session.add(assoc)
-    await db_session.commit()
+    await db_session.flush()
 
     # Try to access project2 campaigns
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        f"/api/v1/control/campaigns?project_id={project2.id}", headers=headers
-    )
+    resp = await async_client.get(f"/api/v1/control/campaigns?project_id={project2.id}")
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
     data = resp.json()
@@ -341,11 +387,10 @@ async def test_list_campaigns_no_project_access(
     db_session: AsyncSession,
 ) -> None:
     """Test that user with no project access gets 403."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # User has no project associations
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get("/api/v1/control/campaigns", headers=headers)
+    resp = await async_client.get("/api/v1/control/campaigns")
     assert resp.status_code == HTTPStatus.FORBIDDEN
 
     data = resp.json()
@@ -355,58 +400,33 @@ async def test_list_campaigns_no_project_access(
 @pytest.mark.asyncio
 async def test_list_campaigns_pagination_limits(
     api_key_client: tuple[AsyncClient, User, str],
-    project_factory: ProjectFactory,
-    db_session: AsyncSession,
 ) -> None:
     """Test pagination parameter validation."""
-    async_client, user, api_key = api_key_client
-
-    # Create project and associate user
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
+    async_client, _user, _api_key = api_key_client
 
     # Test limit too high
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?limit=101", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?limit=101")
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
     # Test limit too low
-    resp = await async_client.get("/api/v1/control/campaigns?limit=0", headers=headers)
+    resp = await async_client.get("/api/v1/control/campaigns?limit=0")
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
     # Test negative offset
-    resp = await async_client.get(
-        "/api/v1/control/campaigns?offset=-1", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/campaigns?offset=-1")
     assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
 
 
 @pytest.mark.asyncio
 async def test_list_campaigns_empty_result(
     api_key_client: tuple[AsyncClient, User, str],
-    project_factory: ProjectFactory,
-    db_session: AsyncSession,
+    authorized_project: Project,
 ) -> None:
     """Test listing campaigns when none exist."""
-    async_client, user, api_key = api_key_client
-
-    # Create project and associate user
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
+    async_client, _user, _api_key = api_key_client
 
     # Test empty result
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get("/api/v1/control/campaigns", headers=headers)
+    resp = await async_client.get("/api/v1/control/campaigns")
     assert resp.status_code == HTTPStatus.OK
 
     data = resp.json()
@@ -1,10 +1,12 @@
 """Test Control API error handling with RFC9457 Problem Details format."""
 
+from collections.abc import AsyncGenerator
 from typing import Never
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI, HTTPException
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from app.api.v1.endpoints.agent.v1_http_exception_handler import (
     v1_http_exception_handler,
@@ -20,9 +22,17 @@
 from app.core.control_rfc9457_middleware import ControlRFC9457Middleware
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def bind_factories_to_session() -> None:
+    """Override the suite-wide session binding; these tests never touch the database."""
+
+
+@pytest.fixture(scope="module")
 def test_app() -> FastAPI:
-    """Create a test FastAPI app with Control RFC9457 middleware and exception handler."""
+    """Create a test FastAPI app with Control RFC9457 middleware and exception handler.
+
+    The app holds no per-test state, so it is built once for the module.
+    """
     app = FastAPI()
 
     # Add Control API RFC9457 middleware
@@ -113,15 +123,18 @@ async def test_client_http_error() -> Never:
     return app
 
 
-@pytest.fixture
-def client(test_app: FastAPI) -> TestClient:
-    """Create a test client."""
-    return TestClient(test_app)
+@pytest_asyncio.fixture
+async def client(test_app: FastAPI) -> AsyncGenerator[AsyncClient]:
+    """Create an in-process client for the module's app."""
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
 
 
-def test_campaign_not_found_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_campaign_not_found_error_format(client: AsyncClient) -> None:
     """Test that CampaignNotFoundError returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/campaign-not-found")
+    response = await client.get("/api/v1/control/test/campaign-not-found")
 
     assert response.status_code == 404
     assert response.headers["content-type"] == "application/problem+json"
@@ -139,9 +152,10 @@ def test_campaign_not_found_error_format(client: TestClient) -> None:
     assert data["instance"] == "/api/v1/control/test/campaign-not-found"
 
 
-def test_insufficient_permissions_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_insufficient_permissions_error_format(client: AsyncClient) -> None:
     """Test that InsufficientPermissionsError returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/insufficient-permissions")
+    response = await client.get("/api/v1/control/test/insufficient-permissions")
 
     assert response.status_code == 403
     assert response.headers["content-type"] == "application/problem+json"
@@ -152,9 +166,10 @@ def test_insufficient_permissions_error_format(client: TestClient) -> None:
     assert data["detail"] == "User lacks required permissions"
 
 
-def test_invalid_attack_config_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_invalid_attack_config_error_format(client: AsyncClient) -> None:
     """Test that InvalidAttackConfigError returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/invalid-attack-config")
+    response = await client.get("/api/v1/control/test/invalid-attack-config")
 
     assert response.status_code == 400
     assert response.headers["content-type"] == "application/problem+json"
@@ -165,9 +180,10 @@ def test_invalid_attack_config_error_format(client: TestClient) -> None:
     assert data["detail"] == "Attack configuration is invalid"
 
 
-def test_project_access_denied_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_project_access_denied_error_format(client: AsyncClient) -> None:
     """Test that ProjectAccessDeniedError returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/project-access-denied")
+    response = await client.get("/api/v1/control/test/project-access-denied")
 
     assert response.status_code == 403
     assert response.headers["content-type"] == "application/problem+json"
@@ -178,9 +194,10 @@ def test_project_access_denied_error_format(client: TestClient) -> None:
     assert data["detail"] == "Access denied to project 'test-project'"
 
 
-def test_error_response_has_required_fields(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_error_response_has_required_fields(client: AsyncClient) -> None:
     """Test that error responses contain all required RFC9457 fields."""
-    response = client.get("/api/v1/control/test/campaign-not-found")
+    response = await client.get("/api/v1/control/test/campaign-not-found")
 
     data = response.json()
 
@@ -198,9 +215,10 @@ def test_error_response_has_required_fields(client: TestClient) -> None:
     assert isinstance(data["instance"], str)
 
 
-def test_internal_server_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_internal_server_error_format(client: AsyncClient) -> None:
     """Test that InternalServerError returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/internal-server-error")
+    response = await client.get("/api/v1/control/test/internal-server-error")
 
     assert response.status_code == 500
     assert response.headers["content-type"] == "application/problem+json"
@@ -211,9 +229,10 @@ def test_internal_server_error_format(client: TestClient) -> None:
     assert data["detail"] == "An internal server error occurred"
 
 
-def test_invalid_state_transition_error_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_invalid_state_transition_error_format(client: AsyncClient) -> None:
     """Test that InvalidStateTransitionProblem returns RFC9457 format with extension fields."""
-    response = client.get("/api/v1/control/test/invalid-state-transition")
+    response = await client.get("/api/v1/control/test/invalid-state-transition")
 
     assert response.status_code == 409
     assert response.headers["content-type"] == "application/problem+json"
@@ -233,9 +252,10 @@ def test_invalid_state_transition_error_format(client: TestClient) -> None:
     assert data["valid_transitions"] == ["completed", "draft"]
 
 
-def test_error_type_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_error_type_format(client: AsyncClient) -> None:
     """Test that error type follows kebab-case convention."""
-    response = client.get("/api/v1/control/test/campaign-not-found")
+    response = await client.get("/api/v1/control/test/campaign-not-found")
 
     data = response.json()
     error_type = data["type"]
@@ -249,109 +269,41 @@ def test_error_type_format(client: TestClient) -> None:
 # HTTPException conversion tests
 
 
-def test_http_exception_400_format(client: TestClient) -> None:
-    """Test that HTTPException with 400 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-400")
-
-    assert response.status_code == 400
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Bad Request"
-    assert data["status"] == 400
-    assert data["detail"] == "Invalid request"
-    assert data["instance"] == "/api/v1/control/test/http-400"
-
-
-def test_http_exception_401_format(client: TestClient) -> None:
-    """Test that HTTPException with 401 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-401")
-
-    assert response.status_code == 401
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Unauthorized"
-    assert data["status"] == 401
-    assert data["detail"] == "Authentication required"
-
-
-def test_http_exception_403_format(client: TestClient) -> None:
-    """Test that HTTPException with 403 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-403")
-
-    assert response.status_code == 403
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Forbidden"
-    assert data["status"] == 403
-    assert data["detail"] == "Access denied"
-
-
-def test_http_exception_404_format(client: TestClient) -> None:
-    """Test that HTTPException with 404 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-404")
-
-    assert response.status_code == 404
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Not Found"
-    assert data["status"] == 404
-    assert data["detail"] == "Resource not found"
-    assert data["instance"] == "/api/v1/control/test/http-404"
-
-
-def test_http_exception_409_format(client: TestClient) -> None:
-    """Test that HTTPException with 409 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-409")
-
-    assert response.status_code == 409
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Conflict"
-    assert data["status"] == 409
-    assert data["detail"] == "Resource conflict"
-
-
-def test_http_exception_422_format(client: TestClient) -> None:
-    """Test that HTTPException with 422 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-422")
-
-    assert response.status_code == 422
-    assert response.headers["content-type"] == "application/problem+json"
-
-    data = response.json()
-    assert data["type"] == "about:blank"
-    assert data["title"] == "Unprocessable Entity"
-    assert data["status"] == 422
-    assert data["detail"] == "Validation failed"
-
-
-def test_http_exception_500_format(client: TestClient) -> None:
-    """Test that HTTPException with 500 status returns RFC9457 format."""
-    response = client.get("/api/v1/control/test/http-500")
-
-    assert response.status_code == 500
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status_code", "title", "detail"),
+    [
+        (400, "Bad Request", "Invalid request"),
+        (401, "Unauthorized", "Authentication required"),
+        (403, "Forbidden", "Access denied"),
+        (404, "Not Found", "Resource not found"),
+        (409, "Conflict", "Resource conflict"),
+        (422, "Unprocessable Entity", "Validation failed"),
+        (500, "Internal Server Error", "Server error"),
+    ],
+)
+async def test_http_exception_format(
+    client: AsyncClient, status_code: int, title: str, detail: str
+) -> None:
+    """Test that HTTPException with a standard status returns RFC9457 format."""
+    path = f"/api/v1/control/test/http-{status_code}"
+    response = await client.get(path)
+
+    assert response.status_code == status_code
     assert response.headers["content-type"] == "application/problem+json"
 
     data = response.json()
     assert data["type"] == "about:blank"
-    assert data["title"] == "Internal Server Error"
-    assert data["status"] == 500
-    assert data["detail"] == "Server error"
+    assert data["title"] == title
+    assert data["status"] == status_code
+    assert data["detail"] == detail
+    assert data["instance"] == path
 
 
-def test_http_exception_dict_detail_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_http_exception_dict_detail_format(client: AsyncClient) -> None:
     """Test that HTTPException with dictionary detail includes extension fields."""
-    response = client.get("/api/v1/control/test/http-dict-detail")
+    response = await client.get("/api/v1/control/test/http-dict-detail")
 
     assert response.status_code == 422
     assert response.headers["content-type"] == "application/problem+json"
@@ -368,9 +320,10 @@ def test_http_exception_dict_detail_format(client: TestClient) -> None:
     assert data["error"] == "required"
 
 
-def test_http_exception_unknown_status_format(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_http_exception_unknown_status_format(client: AsyncClient) -> None:
     """Test that HTTPException with unknown status code uses default title."""
-    response = client.get("/api/v1/control/test/http-unknown-status")
+    response = await client.get("/api/v1/control/test/http-unknown-status")
 
     assert response.status_code == 418
     assert response.headers["content-type"] == "application/problem+json"
@@ -382,9 +335,10 @@ def test_http_exception_unknown_status_format(client: TestClient) -> None:
     assert data["detail"] == "I'm a teapot"
 
 
-def test_http_exception_has_required_fields(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_http_exception_has_required_fields(client: AsyncClient) -> None:
     """Test that HTTPException responses contain all required RFC9457 fields."""
-    response = client.get("/api/v1/control/test/http-404")
+    response = await client.get("/api/v1/control/test/http-404")
 
     data = response.json()
 
@@ -402,9 +356,12 @@ def test_http_exception_has_required_fields(client: TestClient) -> None:
     assert isinstance(data["instance"], str)
 
 
-def test_middleware_only_affects_control_api_web_path(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_middleware_only_affects_control_api_web_path(
+    client: AsyncClient,
+) -> None:
     """Test that middleware does NOT convert HTTPException on Web API paths."""
-    response = client.get("/api/v1/web/test/http-error")
+    response = await client.get("/api/v1/web/test/http-error")
 
     assert response.status_code == 404
     # Should NOT be RFC9457 format - FastAPI default JSON response
@@ -415,9 +372,12 @@ def test_middleware_only_affects_control_api_web_path(client: TestClient) -> Non
     assert data == {"detail": "Not found"}
 
 
-def test_middleware_only_affects_control_api_client_path(client: TestClient) -> None:
+@pytest.mark.asyncio
+async def test_middleware_only_affects_control_api_client_path(
+    client: AsyncClient,
+) -> None:
     """Test that middleware does NOT convert HTTPException on Client API paths."""
-    response = client.get("/api/v1/client/test/http-error")
+    response = await client.get("/api/v1/client/test/http-error")
 
     assert response.status_code == 404
     # Should NOT be RFC9457 format - uses agent/client error envelope format
@@ -11,8 +11,10 @@
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
 from app.models.user import User
 from tests.factories.project_factory import ProjectFactory
+from tests.factories.user_factory import UserFactory
 from tests.utils.test_helpers import create_user_with_api_key_and_project_access
 
 
@@ -45,16 +47,13 @@ async def test_get_project_without_access(
     project_factory: ProjectFactory,
 ) -> None:
     """Test that user cannot access project detail when they don't have access."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Create a project but don't associate user with it
     project = await project_factory.create_async()
 
     # Test accessing the project should fail
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        f"/api/v1/control/projects/{project.id}", headers=headers
-    )
+    resp = await async_client.get(f"/api/v1/control/projects/{project.id}")
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     data = resp.json()
@@ -69,11 +68,10 @@ async def test_get_nonexistent_project(
     api_key_client: tuple[AsyncClient, User, str],
 ) -> None:
     """Test that accessing a nonexistent project returns 404."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Test accessing a nonexistent project
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get("/api/v1/control/projects/99999", headers=headers)
+    resp = await async_client.get("/api/v1/control/projects/99999")
 
     assert (
         resp.status_code == HTTPStatus.NOT_FOUND
@@ -83,22 +81,15 @@ async def test_get_nonexistent_project(
 @pytest.mark.asyncio
 async def test_update_project_with_access(
     api_key_client: tuple[AsyncClient, User, str],
-    project_factory: ProjectFactory,
-    db_session: AsyncSession,
+    authorized_project: Project,
 ) -> None:
     """Test that user can update project when they have access."""
-    async_client, _user, api_key = api_key_client
-
-    # Create a user with access to a project using helper
-    _, project_id, api_key = await create_user_with_api_key_and_project_access(
-        db_session, user_name="Test User", project_name="Test Project"
-    )
+    async_client, _user, _api_key = api_key_client
 
     # Test updating the project
-    headers = {"Authorization": f"Bearer {api_key}"}
     update_data = {"name": "Updated Project Name"}
     resp = await async_client.patch(
-        f"/api/v1/control/projects/{project_id}", headers=headers, json=update_data
+        f"/api/v1/control/projects/{authorized_project.id}", json=update_data
     )
 
     assert resp.status_code == HTTPStatus.OK
@@ -112,16 +103,15 @@ async def test_update_project_without_access(
     project_factory: ProjectFactory,
 ) -> None:
     """Test that user cannot update project when they don't have access."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Create a project but don't associate user with it
     project = await project_factory.create_async()
 
     # Test updating the project should fail
-    headers = {"Authorization": f"Bearer {api_key}"}
     update_data = {"name": "Updated Project Name"}
     resp = await async_client.patch(
-        f"/api/v1/control/projects/{project.id}", headers=headers, json=update_data
+        f"/api/v1/control/projects/{project.id}", json=update_data
     )
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
@@ -135,20 +125,14 @@ async def test_update_project_without_access(
 @pytest.mark.asyncio
 async def test_delete_project_with_access(
     api_key_client: tuple[AsyncClient, User, str],
-    db_session: AsyncSession,
+    authorized_project: Project,
 ) -> None:
     """Test that user can delete project when they have access."""
-    async_client, _user, api_key = api_key_client
-
-    # Create a user with access to a project using helper
-    _user_id, project_id, api_key = await create_user_with_api_key_and_project_access(
-        db_session, user_name="Test User", project_name="Test Project"
-    )
+    async_client, _user, _api_key = api_key_client
 
     # Test deleting the project
-    headers = {"Authorization": f"Bearer {api_key}"}
     resp = await async_client.delete(
-        f"/api/v1/control/projects/{project_id}", headers=headers
+        f"/api/v1/control/projects/{authorized_project.id}"
     )
 
     assert resp.status_code == HTTPStatus.NO_CONTENT
@@ -160,16 +144,13 @@ async def test_delete_project_without_access(
     project_factory: ProjectFactory,
 ) -> None:
     """Test that user cannot delete project when they don't have access."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Create a project but don't associate user with it
     project = await project_factory.create_async()
 
     # Test deleting the project should fail
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.delete(
-        f"/api/v1/control/projects/{project.id}", headers=headers
-    )
+    resp = await async_client.delete(f"/api/v1/control/projects/{project.id}")
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     data = resp.json()
@@ -217,15 +198,16 @@ async def test_list_projects_offset_pagination(
         db_session, user_name="Test User", project_name="Project Alpha"
     )
 
-    # Create additional projects and associate the user with them
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    project_beta = await project_factory.create_async(name="Project Beta")
-    project_gamma = await project_factory.create_async(name="Project Gamma")
-    project_delta = await project_factory.create_async(name="Project Delta")
+    # Create additional projects in one INSERT and associate the user with them
+    projects = [
+        project_factory.build(name=name)
+        for name in ("Project Beta", "Project Gamma", "Project Delta")
+    ]
+    db_session.add_all(projects)
+    await db_session.flush()
 
     # Associate user with the additional projects
-    for project in [project_beta, project_gamma, project_delta]:
+    for project in projects:
         assoc = ProjectUserAssociation(
             project_id=project.id, user_id=user_id, role=ProjectUserRole.member
         )
@@ -310,16 +292,13 @@ async def test_list_project_users_without_access(
     project_factory: ProjectFactory,
 ) -> None:
     """Test that user cannot list project users when they don't have access."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Create a project but don't associate user with it
     project = await project_factory.create_async()
 
     # Test listing project users should fail
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        f"/api/v1/control/projects/{project.id}/users", headers=headers
-    )
+    resp = await async_client.get(f"/api/v1/control/projects/{project.id}/users")
 
     assert resp.status_code == HTTPStatus.FORBIDDEN
     data = resp.json()
@@ -334,13 +313,10 @@ async def test_list_project_users_nonexistent_project(
     api_key_client: tuple[AsyncClient, User, str],
 ) -> None:
     """Test that listing users for a nonexistent project returns 404."""
-    async_client, _user, api_key = api_key_client
+    async_client, _user, _api_key = api_key_client
 
     # Test listing users for a nonexistent project
-    headers = {"Authorization": f"Bearer {api_key}"}
-    resp = await async_client.get(
-        "/api/v1/control/projects/99999/users", headers=headers
-    )
+    resp = await async_client.get("/api/v1/control/projects/99999/users")
 
     assert resp.status_code == HTTPStatus.NOT_FOUND
     data = resp.json()
@@ -354,9 +330,6 @@ async def test_list_project_users_pagination(
     project_factory: ProjectFactory,
 ) -> None:
     """Test that pagination works correctly for project users listing."""
-    from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
-    from tests.factories.user_factory import UserFactory
-
     # Create a project and a user with access using the helper
     _, project_id, api_key = await create_user_with_api_key_and_project_access(
         db_session, user_name="Main User", project_name="Test Project"
@@ -366,13 +339,16 @@ async def test_list_project_users_pagination(
     project = await db_session.get(Project, project_id)
     assert project is not None
 
-    # Create additional users and associate them with the project
-    for i in range(4):  # Create 4 more users (total 5 with the main user)
-        user = await UserFactory.create_async(
-            name=f"User {i + 2}", email=f"user{i + 2}@example.com"
-        )
+    # Create 4 more users in one INSERT (total 5 with the main user)
+    users = [
+        UserFactory.build(name=f"User {i + 2}", email=f"user{i + 2}@example.com")
+        for i in range(4)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
 
-        # Associate user with project
+    # Associate the users with the project
+    for user in users:
         assoc = ProjectUserAssociation(
             project_id=project.id, user_id=user.id, role=ProjectUserRole.member
         )
@@ -0,0 +1,28 @@
+# Copyright (c) 2026 UncleSp1d3r
+# SPDX-License-Identifier: MPL-2.0
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
+from app.models.user import User
+from tests.factories.project_factory import ProjectFactory
+
+
+@pytest_asyncio.fixture
+async def member_project(
+    authenticated_user_client: tuple[AsyncClient, User],
+    project_factory: ProjectFactory,
+    db_session: AsyncSession,
+) -> Project:
+    """Create a project the authenticated_user_client user is a member of."""
+    _, user = authenticated_user_client
+    project = await project_factory.create_async()
+    db_session.add(
+        ProjectUserAssociation(
+            project_id=project.id, user_id=user.id, role=ProjectUserRole.member
+        )
+    )
+    await db_session.flush()
+    return project
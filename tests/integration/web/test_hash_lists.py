@@ -2,43 +2,48 @@
 Integration tests for hash list web endpoints.
 """
 
+from dataclasses import dataclass
 from http import HTTPStatus
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.hash_list import HashList
+from app.models.project import Project
 from app.models.user import User
-from tests.factories.hash_item_factory import HashItemFactory
+from tests.factories.campaign_factory import CampaignFactory
 from tests.factories.hash_list_factory import HashListFactory
 from tests.factories.project_factory import ProjectFactory
 from tests.utils.hash_type_utils import get_or_create_hash_type
+from tests.utils.test_helpers import create_batch, create_hash_list_with_items
+
+
+@dataclass(frozen=True)
+class ListCase:
+    """Hash lists to seed, the listing query, and the expected page shape."""
+
+    names: list[str]
+    query: str
+    expected_items: int
+    expected_total: int
 
 
 @pytest.mark.asyncio
 async def test_create_hash_list_success(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
+    member_project: Project,
 ) -> None:
     """Test successful hash list creation."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
     # Create hash list
     response = await authenticated_async_client.post(
         "/api/v1/web/hash_lists/",
@@ -100,122 +105,125 @@ async def test_create_hash_list_unauthorized(
 
 
 @pytest.mark.asyncio
-async def test_list_hash_lists_success(
+@pytest.mark.parametrize(
+    "case",
+    [
+        ListCase(["Hash List 1", "Hash List 2"], "", 2, 2),
+        ListCase([f"Hash List {i}" for i in range(5)], "?page=2&size=2", 2, 5),
+        ListCase(
+            ["Alpha Hash List", "Beta Hash List", "Alpha Test"], "?name=alpha", 2, 2
+        ),
+    ],
+)
+async def test_list_hash_lists(
     authenticated_async_client: AsyncClient,
     db_session: AsyncSession,
     project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
+    case: ListCase,
 ) -> None:
-    """Test successful hash list listing."""
+    """Test hash list listing with pagination and name filtering."""
 
     # Create test data
     project = await project_factory.create_async()
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    await hash_list_factory.create_async(
-        name="Hash List 1",
-        project_id=project.id,
-        hash_type_id=hash_type.id,
-    )
-    await hash_list_factory.create_async(
-        name="Hash List 2",
+    await create_batch(
+        db_session,
+        HashListFactory,
+        [{"name": name} for name in case.names],
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    response = await authenticated_async_client.get("/api/v1/web/hash_lists/")
+    response = await authenticated_async_client.get(
+        f"/api/v1/web/hash_lists/{case.query}"
+    )
 
     assert response.status_code == HTTPStatus.OK
     data = response.json()
     assert "items" in data
     assert "total" in data
-    assert len(data["items"]) == 2
+    assert len(data["items"]) == case.expected_items
+    assert data["total"] == case.expected_total
 
 
 @pytest.mark.asyncio
-async def test_list_hash_lists_with_pagination(
+async def test_list_hash_lists_cursor_pagination(
     authenticated_async_client: AsyncClient,
     db_session: AsyncSession,
     project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
 ) -> None:
-    """Test hash list listing with pagination."""
-    # Set factory sessions
-
-    # Create test data
+    """Test that next_cursor walks every hash list exactly once."""
     project = await project_factory.create_async()
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
+    names = [f"Hash List {i}" for i in range(5)]
+    await create_batch(
+        db_session,
+        HashListFactory,
+        [{"name": name} for name in names],
+        project_id=project.id,
+        hash_type_id=hash_type.id,
+    )
 
-    for i in range(5):
-        await hash_list_factory.create_async(
-            name=f"Hash List {i}",
-            project_id=project.id,
-            hash_type_id=hash_type.id,
-        )
+    seen: list[str] = []
+    url = "/api/v1/web/hash_lists/?size=2"
+    while True:
+        response = await authenticated_async_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(item["name"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        url = f"/api/v1/web/hash_lists/?size=2&cursor={data['next_cursor']}"
 
+    assert sorted(seen) == names
+
+
+@pytest.mark.asyncio
+async def test_list_hash_lists_invalid_cursor(
+    authenticated_async_client: AsyncClient,
+) -> None:
+    """Test that a malformed cursor is rejected with a 400."""
     response = await authenticated_async_client.get(
-        "/api/v1/web/hash_lists/?page=2&size=2"
+        "/api/v1/web/hash_lists/?cursor=not-a-cursor"
     )
 
-    assert response.status_code == HTTPStatus.OK
-    data = response.json()
-    assert len(data["items"]) == 2
-    assert data["total"] == 5
+    assert response.status_code == HTTPStatus.BAD_REQUEST
 
 
 @pytest.mark.asyncio
 async def test_list_hash_list_items_success(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test successful hash list items listing."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [
+            {
+                "hash": f"hash{i}",
+                # First 2 are cracked
+                "plain_text": f"password{i}" if i < 2 else None,
+                "meta": {"username": f"user{i}"},
+            }
+            for i in range(5)
+        ],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items
-    hash_items = []
-    for i in range(5):
-        hash_item = await hash_item_factory.create_async(
-            hash=f"hash{i}",
-            plain_text=f"password{i}" if i < 2 else None,  # First 2 are cracked
-            meta={"username": f"user{i}"},
-        )
-        hash_items.append(hash_item)
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test the endpoint
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items"
@@ -241,55 +249,26 @@ async def test_list_hash_list_items_success(
 async def test_list_hash_list_items_with_pagination(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test hash list items listing with pagination."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [{"hash": f"hash{i:02d}", "plain_text": None} for i in range(10)],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items
-    hash_items = []
-    for i in range(10):
-        hash_item = await hash_item_factory.create_async(
-            id=None,  # Let the database auto-generate IDs
-            hash=f"hash{i:02d}",
-            plain_text=None,
-        )
-        hash_items.append(hash_item)
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test pagination
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items?page=2&size=3"
@@ -307,52 +286,30 @@ async def test_list_hash_list_items_with_pagination(
 async def test_list_hash_list_items_with_search(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test hash list items listing with search functionality."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [
+            {"hash": "abc123", "plain_text": "password1"},
+            {"hash": "def456", "plain_text": "secret"},
+            {"hash": "ghi789", "plain_text": None},
+        ],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items with specific patterns
-    hash_items = [
-        await hash_item_factory.create_async(hash="abc123", plain_text="password1"),
-        await hash_item_factory.create_async(hash="def456", plain_text="secret"),
-        await hash_item_factory.create_async(hash="ghi789", plain_text=None),
-    ]
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test search by hash value
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items?search=abc"
@@ -378,53 +335,31 @@ async def test_list_hash_list_items_with_search(
 async def test_list_hash_list_items_with_status_filter(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test hash list items listing with status filtering."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [
+            {"hash": "cracked1", "plain_text": "password1"},
+            {"hash": "cracked2", "plain_text": "password2"},
+            {"hash": "uncracked1", "plain_text": None},
+            {"hash": "uncracked2", "plain_text": None},
+        ],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items - some cracked, some not
-    hash_items = [
-        await hash_item_factory.create_async(hash="cracked1", plain_text="password1"),
-        await hash_item_factory.create_async(hash="cracked2", plain_text="password2"),
-        await hash_item_factory.create_async(hash="uncracked1", plain_text=None),
-        await hash_item_factory.create_async(hash="uncracked2", plain_text=None),
-    ]
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test filter for cracked hashes
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items?status_filter=cracked"
@@ -454,61 +389,34 @@ async def test_list_hash_list_items_with_status_filter(
 async def test_list_hash_list_items_csv_export(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test hash list items CSV export functionality."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [
+            {
+                "hash": "abc123",
+                "salt": "salt1",
+                "plain_text": "password1",
+                "meta": {"username": "user1"},
+            },
+            {"hash": "def456", "salt": None, "plain_text": None, "meta": None},
+        ],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items
-    hash_items = [
-        await hash_item_factory.create_async(
-            hash="abc123",
-            salt="salt1",
-            plain_text="password1",
-            meta={"username": "user1"},
-        ),
-        await hash_item_factory.create_async(
-            hash="def456",
-            salt=None,
-            plain_text=None,
-            meta=None,
-        ),
-    ]
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test CSV export
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items?export_format=csv"
@@ -536,55 +444,33 @@ async def test_list_hash_list_items_csv_export(
 async def test_list_hash_list_items_tsv_export(
     authenticated_user_client: tuple[AsyncClient, User],
     db_session: AsyncSession,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    hash_item_factory: HashItemFactory,
+    member_project: Project,
 ) -> None:
     """Test hash list items TSV export functionality."""
 
-    # Get authenticated client and user
-    authenticated_async_client, user = authenticated_user_client
+    # Get authenticated client
+    authenticated_async_client, _ = authenticated_user_client
 
     # Create test data
-    project = await project_factory.create_async()
+    project = member_project
     hash_type = await get_or_create_hash_type(db_session, 100, "sha256")
 
-    # Associate user with project
-    from app.models.project import ProjectUserAssociation, ProjectUserRole
-
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-
-    # Create hash list
-    hash_list = await hash_list_factory.create_async(
+    # Create the hash list and its items in one commit
+    hash_list = await create_hash_list_with_items(
+        db_session,
+        [
+            {
+                "hash": "abc123",
+                "salt": "salt1",
+                "plain_text": "password1",
+                "meta": {"username": "user1"},
+            },
+        ],
         name="Test Hash List",
         project_id=project.id,
         hash_type_id=hash_type.id,
     )
 
-    # Create hash items
-    hash_items = [
-        await hash_item_factory.create_async(
-            hash="abc123",
-            salt="salt1",
-            plain_text="password1",
-            meta={"username": "user1"},
-        ),
-    ]
-
-    # Associate hash items with hash list using the association table
-    from app.models.hash_list import hash_list_items
-
-    for hash_item in hash_items:
-        stmt = hash_list_items.insert().values(
-            hash_list_id=hash_list.id, hash_item_id=hash_item.id
-        )
-        await db_session.execute(stmt)
-    await db_session.commit()
-
     # Test TSV export
     response = await authenticated_async_client.get(
         f"/api/v1/web/hash_lists/{hash_list.id}/items?export_format=tsv"
@@ -670,3 +556,32 @@ async def test_list_hash_list_items_forbidden_project_access(
     )
 
     assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_delete_hash_list_in_use_by_campaign(
+    authenticated_admin_client: AsyncClient,
+    db_session: AsyncSession,
+    project_factory: ProjectFactory,
+    hash_list_factory: HashListFactory,
+    campaign_factory: CampaignFactory,
+) -> None:
+    """Test that a hash list used by a campaign cannot be deleted."""
+    # Each row needs the previous one's ID, so flush between them and commit once
+    project = project_factory.build()
+    db_session.add(project)
+    await db_session.flush()
+    hash_list = hash_list_factory.build(project_id=project.id)
+    db_session.add(hash_list)
+    await db_session.flush()
+    db_session.add(
+        campaign_factory.build(project_id=project.id, hash_list_id=hash_list.id)
+    )
+    await db_session.commit()
+
+    response = await authenticated_admin_client.delete(
+        f"/api/v1/web/hash_lists/{hash_list.id}"
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert await db_session.get(HashList, hash_list.id) is not None
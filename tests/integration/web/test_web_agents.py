@@ -143,7 +143,7 @@ async def test_toggle_agent_enabled(
 async def test_agent_benchmark_summary_fragment(
     async_client: AsyncClient, db_session: AsyncSession
 ) -> None:
-    # Use pre-seeded hash types from reset_db_and_seed_hash_types
+    # Use hash types pre-seeded into the template database (pg_template_db)
     md5 = await db_session.execute(select(HashType).where(HashType.id == 0))
     sha1 = await db_session.execute(select(HashType).where(HashType.id == 100))
     ht1 = md5.scalar_one()
@@ -598,7 +598,7 @@ async def test_agent_capabilities_endpoint(
     await db_session.refresh(admin_user)
     token = create_access_token(admin_user.id)
     async_client.cookies.set("access_token", token)
-    # Use pre-seeded hash types from reset_db_and_seed_hash_types
+    # Use hash types pre-seeded into the template database (pg_template_db)
     md5 = await db_session.execute(select(HashType).where(HashType.id == 0))
     sha1 = await db_session.execute(select(HashType).where(HashType.id == 100))
     ht1 = md5.scalar_one()
@@ -17,6 +17,7 @@
 from tests.factories.hash_list_factory import HashListFactory
 from tests.factories.project_factory import ProjectFactory
 from tests.factories.task_factory import TaskFactory
+from tests.utils.test_helpers import create_attack_stack
 
 CAMPAIGN_TEST_ID = 123
 AGENT_TEST_ID = 42
@@ -65,23 +66,13 @@ async def test_estimate_attack_non_json(async_client: AsyncClient) -> None:
 @pytest.mark.asyncio
 async def test_attack_export_import_json(
     async_client: AsyncClient,
-    attack_factory: AttackFactory,
-    campaign_factory: CampaignFactory,
-    hash_list_factory: HashListFactory,
+    db_session: AsyncSession,
     project_factory: ProjectFactory,
 ) -> None:
-    # Create required parent objects
+    # Create an attack with its parent hash list and campaign
     project = await project_factory.create_async()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        project_id=project.id, hash_list_id=hash_list.id
-    )
-    # Create an attack linked to the campaign and hash list
-    attack = await attack_factory.create_async(
-        name="ExportTest",
-        attack_mode="dictionary",
-        campaign_id=campaign.id,
-        hash_list_id=hash_list.id,
+    _, _, attack = await create_attack_stack(
+        db_session, project.id, name="ExportTest", attack_mode="dictionary"
     )
     # Export the attack as JSON template
     resp = await async_client.get(f"/api/v1/web/attacks/{attack.id}/export")
@@ -112,23 +103,17 @@ async def test_attack_export_import_json(
 @pytest.mark.asyncio
 async def test_edit_attack_lifecycle_reset_triggers_reprocessing(
     async_client: AsyncClient,
-    attack_factory: AttackFactory,
-    campaign_factory: CampaignFactory,
-    hash_list_factory: HashListFactory,
+    db_session: AsyncSession,
     project_factory: ProjectFactory,
     task_factory: TaskFactory,
 ) -> None:
     # Setup: create project, hash list, campaign, attack (running), and tasks (running)
     project = await project_factory.create_async()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        project_id=project.id, hash_list_id=hash_list.id
-    )
-    attack = await attack_factory.create_async(
+    _, _, attack = await create_attack_stack(
+        db_session,
+        project.id,
         name="LifecycleResetTest",
         attack_mode="dictionary",
-        campaign_id=campaign.id,
-        hash_list_id=hash_list.id,
         state="running",
     )
     # Create two tasks for this attack, both running
@@ -475,37 +460,9 @@ async def test_validate_mask_invalid_token(async_client: AsyncClient) -> None:
     assert "Invalid mask token" in data["error"]
 
 
-@pytest.mark.asyncio
-async def test_validate_mask_empty(async_client: AsyncClient) -> None:
-    resp = await async_client.post(
-        "/api/v1/web/attacks/validate_mask",
-        json={"mask": "   "},
-    )
-    assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
-    data = resp.json()
-    assert data["valid"] is False
-    assert "empty" in data["error"]
-
-
-@pytest.mark.asyncio
-async def test_validate_mask_too_long(async_client: AsyncClient) -> None:
-    long_mask = "?l" * 130  # 260 chars
-    resp = await async_client.post(
-        "/api/v1/web/attacks/validate_mask",
-        json={"mask": long_mask},
-    )
-    assert resp.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
-    data = resp.json()
-    assert data["valid"] is False
-    assert "maximum length" in data["error"]
-
-
 @pytest.mark.asyncio
 async def test_attack_performance_summary(
     async_client: AsyncClient,
-    attack_factory: AttackFactory,
-    campaign_factory: CampaignFactory,
-    hash_list_factory: HashListFactory,
     project_factory: ProjectFactory,
     task_factory: TaskFactory,
     agent_factory: AgentFactory,
@@ -513,16 +470,9 @@ async def test_attack_performance_summary(
 ) -> None:
     # Setup: create project, hash list, campaign, agent, attack, and tasks
     project = await project_factory.create_async()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        project_id=project.id, hash_list_id=hash_list.id
-    )
     agent = await agent_factory.create_async()
-    attack = await attack_factory.create_async(
-        name="PerfTest",
-        attack_mode="dictionary",
-        campaign_id=campaign.id,
-        hash_list_id=hash_list.id,
+    _, _, attack = await create_attack_stack(
+        db_session, project.id, name="PerfTest", attack_mode="dictionary"
     )
     # Create tasks for this attack, assign to agent
     await task_factory.create_async(
@@ -555,7 +505,7 @@ async def test_attack_performance_summary(
 @pytest.mark.asyncio
 async def test_attack_list_pagination_and_search(
     async_client: AsyncClient,
-    attack_factory: AttackFactory,
+    db_session: AsyncSession,
     campaign_factory: CampaignFactory,
     hash_list_factory: HashListFactory,
     project_factory: ProjectFactory,
@@ -567,13 +517,18 @@ async def test_attack_list_pagination_and_search(
         project_id=project.id, hash_list_id=hash_list.id
     )
     names = ["AlphaAttack", "BetaAttack", "GammaAttack", "DeltaAttack"]
-    for name in names:
-        await attack_factory.create_async(
-            name=name,
-            attack_mode="dictionary",
-            campaign_id=campaign.id,
-            hash_list_id=hash_list.id,
-        )
+    db_session.add_all(
+        [
+            AttackFactory.build(
+                name=name,
+                attack_mode="dictionary",
+                campaign_id=campaign.id,
+                hash_list_id=hash_list.id,
+            )
+            for name in names
+        ]
+    )
+    await db_session.commit()
     # Fetch first page (fragment)
     resp = await async_client.get(
         f"/api/v1/web/attacks/attack_table_body?page=1&size={PAGE_SIZE}"
@@ -614,9 +569,7 @@ async def test_bulk_delete_attacks_happy_path(
     campaign = await CampaignFactory.create_async(
         project_id=project.id, hash_list_id=hash_list.id
     )
-    attacks = [
-        await attack_factory.create_async(campaign_id=campaign.id) for _ in range(3)
-    ]
+    attacks = await attack_factory.create_batch_async(3, campaign_id=campaign.id)
     ids = [a.id for a in attacks]
     resp = await async_client.request(
         "DELETE",
@@ -1,4 +1,5 @@
 import json
+from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any
 
@@ -6,9 +7,10 @@
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from app.models.project import ProjectUserAssociation, ProjectUserRole
+from app.models.attack import Attack, AttackState
+from app.models.project import Project, ProjectUserAssociation, ProjectUserRole
+from app.models.task import Task, TaskStatus
 from app.models.user import User
 from app.schemas.shared import CampaignTemplate
 from tests.factories.campaign_factory import CampaignFactory
@@ -20,116 +22,58 @@
 CRACKED_THRESHOLD = 2
 
 
-@pytest.mark.asyncio
-async def test_start_stop_campaign_happy_path(
-    authenticated_user_client: tuple[AsyncClient, User],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    db_session: AsyncSession,
-) -> None:
-    async_client, user = authenticated_user_client
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        state="draft", project_id=project.id, hash_list_id=hash_list.id
-    )
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/start")
-    assert resp.status_code == HTTPStatus.OK
-    data = resp.json()
-    assert data["id"] == campaign.id
-    assert data["state"] == "active"
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/stop")
-    assert resp.status_code == HTTPStatus.OK
-    data = resp.json()
-    assert data["id"] == campaign.id
-    assert data["state"] == "draft"
-
-
-@pytest.mark.asyncio
-async def test_start_campaign_already_active(
-    authenticated_user_client: tuple[AsyncClient, User],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    db_session: AsyncSession,
-) -> None:
-    async_client, user = authenticated_user_client
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        state="active", project_id=project.id, hash_list_id=hash_list.id
-    )
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/start")
-    assert resp.status_code == HTTPStatus.OK
-    data = resp.json()
-    assert data["id"] == campaign.id
-    assert data["state"] == "active"
+@dataclass(frozen=True)
+class TransitionCase:
+    """A start/stop action on a campaign and the response it should get."""
 
-
-@pytest.mark.asyncio
-async def test_stop_campaign_already_draft(
-    authenticated_user_client: tuple[AsyncClient, User],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-    db_session: AsyncSession,
-) -> None:
-    async_client, user = authenticated_user_client
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
-    )
-    db_session.add(assoc)
-    await db_session.commit()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        state="draft", project_id=project.id, hash_list_id=hash_list.id
-    )
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/stop")
-    assert resp.status_code == HTTPStatus.OK
-    data = resp.json()
-    assert data["id"] == campaign.id
-    assert data["state"] == "draft"
+    initial_state: str
+    action: str
+    expected_status: HTTPStatus
+    expected_state: str | None
 
 
 @pytest.mark.asyncio
-async def test_start_stop_campaign_archived(
+@pytest.mark.parametrize(
+    "case",
+    [
+        TransitionCase("draft", "start", HTTPStatus.OK, "active"),
+        TransitionCase("active", "stop", HTTPStatus.OK, "draft"),
+        # Transitions to the current state are accepted as no-ops
+        TransitionCase("active", "start", HTTPStatus.OK, "active"),
+        TransitionCase("draft", "stop", HTTPStatus.OK, "draft"),
+        TransitionCase("archived", "start", HTTPStatus.BAD_REQUEST, None),
+        TransitionCase("archived", "stop", HTTPStatus.BAD_REQUEST, None),
+    ],
+)
+async def test_campaign_lifecycle_transition(
     authenticated_user_client: tuple[AsyncClient, User],
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
+    member_project: Project,
     db_session: AsyncSession,
+    case: TransitionCase,
 ) -> None:
-    async_client, user = authenticated_user_client
-    project = await project_factory.create_async()
-    assoc = ProjectUserAssociation(
-        project_id=project.id, user_id=user.id, role=ProjectUserRole.member
+    async_client, _ = authenticated_user_client
+    # Flush the hash list for its ID and commit the whole setup once
+    hash_list = HashListFactory.build(project_id=member_project.id)
+    db_session.add(hash_list)
+    await db_session.flush()
+    campaign = CampaignFactory.build(
+        state=case.initial_state,
+        project_id=member_project.id,
+        hash_list_id=hash_list.id,
     )
-    db_session.add(assoc)
+    db_session.add(campaign)
     await db_session.commit()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        state="archived", project_id=project.id, hash_list_id=hash_list.id
-    )
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/start")
-    assert resp.status_code == HTTPStatus.BAD_REQUEST
-    data = resp.json()
-    assert "Cannot start campaign from state 'archived'" in data["detail"]
-    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/stop")
-    assert resp.status_code == HTTPStatus.BAD_REQUEST
+    resp = await async_client.post(f"/api/v1/web/campaigns/{campaign.id}/{case.action}")
+    assert resp.status_code == case.expected_status
     data = resp.json()
-    assert "Cannot stop campaign from state 'archived'" in data["detail"]
+    if case.expected_state is None:
+        assert (
+            f"Cannot {case.action} campaign from state '{case.initial_state}'"
+            in data["detail"]
+        )
+    else:
+        assert data["id"] == campaign.id
+        assert data["state"] == case.expected_state
 
 
 @pytest.mark.asyncio
@@ -240,18 +184,20 @@ async def test_campaign_detail_not_found(
 
 
 @pytest.mark.asyncio
-async def test_archive_campaign_happy_path(
+@pytest.mark.parametrize("state", ["active", "archived"])
+async def test_archive_campaign(
     authenticated_async_client: AsyncClient,
     campaign_factory: CampaignFactory,
     project_factory: ProjectFactory,
     hash_list_factory: HashListFactory,
+    state: str,
 ) -> None:
+    # Archiving is idempotent: an already archived campaign is a no-op
     project = await project_factory.create_async()
     hash_list = await hash_list_factory.create_async(project_id=project.id)
     campaign = await campaign_factory.create_async(
-        state="active", project_id=project.id, hash_list_id=hash_list.id
+        state=state, project_id=project.id, hash_list_id=hash_list.id
     )
-    # Archive the campaign
     resp = await authenticated_async_client.delete(
         f"/api/v1/web/campaigns/{campaign.id}"
     )
@@ -268,24 +214,6 @@ async def test_archive_campaign_not_found(
     assert "Campaign 999999 not found" in data["detail"]
 
 
-@pytest.mark.asyncio
-async def test_archive_campaign_already_archived(
-    authenticated_async_client: AsyncClient,
-    campaign_factory: CampaignFactory,
-    project_factory: ProjectFactory,
-    hash_list_factory: HashListFactory,
-) -> None:
-    project = await project_factory.create_async()
-    hash_list = await hash_list_factory.create_async(project_id=project.id)
-    campaign = await campaign_factory.create_async(
-        state="archived", project_id=project.id, hash_list_id=hash_list.id
-    )
-    resp = await authenticated_async_client.delete(
-        f"/api/v1/web/campaigns/{campaign.id}"
-    )
-    assert resp.status_code == HTTPStatus.NO_CONTENT
-
-
 @pytest.mark.asyncio
 async def test_add_attack_to_campaign_happy_path(
     authenticated_async_client: AsyncClient,
@@ -490,37 +418,23 @@ async def test_campaign_metrics_fragment_happy_path(
 
     await get_or_create_hash_type(db_session, 0)
 
-    hash_list = await hash_list_factory.create_async(
-        project_id=project.id, hash_type_id=0
-    )
-
-    # Create and persist hash items
+    # Build the hash items, hash list and campaign, then write them in one commit
     hash_items = [
-        await hash_item_factory.create_async(
+        hash_item_factory.build(
             hash=f"hash{i}", plain_text=(f"pw{i}" if i < CRACKED_THRESHOLD else None)
         )
         for i in range(5)
     ]
-    db_session.add_all(hash_items)
-    await db_session.commit()
-
-    # Reload hash_list with selectinload, extend items, add and commit
-    result = await db_session.execute(
-        select(hash_list.__class__)
-        .options(selectinload(hash_list.__class__.items))
-        .where(hash_list.__class__.id == hash_list.id)
-    )
-    hash_list_db = result.scalar_one_or_none()
-    assert hash_list_db is not None, "hash_list not found in session after commit"
-    hash_list_db.items = list(hash_items)
-    db_session.add(hash_list_db)
-    await db_session.commit()
-    await db_session.refresh(hash_list_db)
+    hash_list = hash_list_factory.build(project_id=project.id, hash_type_id=0)
+    hash_list.items = hash_items
+    db_session.add(hash_list)
+    await db_session.flush()
 
-    # Now create the campaign
-    campaign = await campaign_factory.create_async(
+    campaign = campaign_factory.build(
         state="active", project_id=project.id, hash_list_id=hash_list.id
     )
+    db_session.add(campaign)
+    await db_session.commit()
     resp = await authenticated_async_client.get(
         f"/api/v1/web/campaigns/{campaign.id}/metrics"
     )
@@ -560,15 +474,15 @@ async def test_relaunch_campaign_resets_failed_attacks(
     campaign = await campaign_factory.create_async(
         state="active", project_id=project.id, hash_list_id=hash_list.id
     )
-    failed_attack = await attack_factory.create_async(
+    failed_attack = attack_factory.build(
         campaign_id=campaign.id, name="Failed Attack", state="failed"
     )
-    completed_attack = await attack_factory.create_async(
+    completed_attack = attack_factory.build(
         campaign_id=campaign.id, name="Completed Attack", state="completed"
     )
+    db_session.add_all([failed_attack, completed_attack])
+    await db_session.flush()
     # Add a failed task to the failed attack
-    from app.models.task import Task, TaskStatus
-
     task = Task(
         attack_id=failed_attack.id,
         agent_id=None,
@@ -589,20 +503,12 @@ async def test_relaunch_campaign_resets_failed_attacks(
     assert data["campaign"]["id"] == campaign.id
     assert isinstance(data["attacks"], list)
     # Check DB: failed attack and its task are now pending
-    from sqlalchemy.future import select
-
-    from app.models.attack import Attack, AttackState
-    from app.models.task import Task as TaskModel
-    from app.models.task import TaskStatus
-
     attack_obj = (
         await db_session.execute(select(Attack).where(Attack.id == failed_attack.id))
     ).scalar_one()
     assert attack_obj.state == AttackState.PENDING
     task_obj = (
-        await db_session.execute(
-            select(TaskModel).where(TaskModel.attack_id == failed_attack.id)
-        )
+        await db_session.execute(select(Task).where(Task.attack_id == failed_attack.id))
     ).scalar_one()
     assert task_obj.status == TaskStatus.PENDING
     # Completed attack is unchanged
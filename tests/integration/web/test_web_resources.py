@@ -19,6 +19,7 @@
 from tests.factories.attack_resource_file_factory import AttackResourceFileFactory
 from tests.factories.hash_list_factory import HashListFactory
 from tests.factories.project_factory import ProjectFactory
+from tests.utils.test_helpers import create_batch
 
 INITIAL_LINE_COUNT = 2
 ADDED_LINE_COUNT = 3
@@ -243,20 +244,37 @@ async def test_file_backed_resource_line_editing(
 @pytest.mark.asyncio
 async def test_resource_line_editing_forbidden_types(
     authenticated_async_client: AsyncClient,
-    attack_resource_file_factory: AttackResourceFileFactory,
+    db_session: AsyncSession,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # Dynamic word list (should be forbidden)
-    resource = await attack_resource_file_factory.create_async(
-        resource_type=AttackResourceType.DYNAMIC_WORD_LIST,
-        source="generated",
-        file_name="dynamic_wordlist.txt",
-        download_url="",
-        checksum="",
-        content=None,
-        line_count=10,
-        byte_size=100,
+    resource, resource2 = await create_batch(
+        db_session,
+        AttackResourceFileFactory,
+        [
+            {
+                "resource_type": AttackResourceType.DYNAMIC_WORD_LIST,
+                "source": "generated",
+                "file_name": "dynamic_wordlist.txt",
+                "download_url": "",
+                "checksum": "",
+                "content": None,
+                "line_count": 10,
+                "byte_size": 100,
+            },
+            {
+                "resource_type": AttackResourceType.WORD_LIST,
+                "source": "upload",
+                "file_name": "oversize_wordlist.txt",
+                "download_url": "",
+                "checksum": "",
+                "content": MutableDict({"lines": MutableList(["a", "b"])}),
+                "line_count": 2,
+                "byte_size": 2000000,
+            },
+        ],
     )
+
+    # Dynamic word list (should be forbidden)
     url = f"/api/v1/web/resources/{resource.id}/lines"
     resp = await authenticated_async_client.get(url)
     error_detail = resp.json().get("detail")
@@ -270,16 +288,6 @@ async def test_resource_line_editing_forbidden_types(
     # Oversize resource (should be forbidden)
     monkeypatch.setattr(core_config.settings, "RESOURCE_EDIT_MAX_LINES", 1)
     monkeypatch.setattr(core_config.settings, "RESOURCE_EDIT_MAX_SIZE_MB", 1)
-    resource2 = await attack_resource_file_factory.create_async(
-        resource_type=AttackResourceType.WORD_LIST,
-        source="upload",
-        file_name="oversize_wordlist.txt",
-        download_url="",
-        checksum="",
-        content=MutableDict({"lines": MutableList(["a", "b"])}),
-        line_count=2,
-        byte_size=2000000,
-    )
     url2 = f"/api/v1/web/resources/{resource2.id}/lines"
     resp2 = await authenticated_async_client.get(url2)
     assert resp2.status_code == HTTPStatus.FORBIDDEN
@@ -879,35 +887,40 @@ async def test_patch_update_resource_content_ephemeral_forbidden(
 async def test_patch_update_resource_content_forbidden(
     authenticated_async_client: AsyncClient,
     db_session: AsyncSession,
-    attack_resource_file_factory: AttackResourceFileFactory,
 ) -> None:
-    # Dynamic word list (forbidden)
-    resource = await attack_resource_file_factory.create_async(
-        resource_type=AttackResourceType.DYNAMIC_WORD_LIST,
-        file_name="dynamic.txt",
-        line_count=2,
-        byte_size=10,
+    resource, resource2, resource3 = await create_batch(
+        db_session,
+        AttackResourceFileFactory,
+        [
+            {
+                "resource_type": AttackResourceType.DYNAMIC_WORD_LIST,
+                "file_name": "dynamic.txt",
+                "line_count": 2,
+                "byte_size": 10,
+            },
+            {
+                "resource_type": AttackResourceType.WORD_LIST,
+                "file_name": "oversize.txt",
+                "line_count": 10000,
+                "byte_size": 10**7,
+            },
+            {
+                "resource_type": AttackResourceType.EPHEMERAL_RULE_LIST,
+                "file_name": "noteditable.txt",
+                "line_count": 2,
+                "byte_size": 10,
+            },
+        ],
     )
+    # Dynamic word list (forbidden)
     url = f"/api/v1/web/resources/{resource.id}/content"
     resp = await authenticated_async_client.patch(url, data={"content": "foo\nbar"})
     assert resp.status_code == HTTPStatus.FORBIDDEN
     # Oversize (forbidden)
-    resource2 = await attack_resource_file_factory.create_async(
-        resource_type=AttackResourceType.WORD_LIST,
-        file_name="oversize.txt",
-        line_count=10000,
-        byte_size=10**7,
-    )
     url2 = f"/api/v1/web/resources/{resource2.id}/content"
     resp2 = await authenticated_async_client.patch(url2, data={"content": "foo\nbar"})
     assert resp2.status_code == HTTPStatus.FORBIDDEN
     # Not editable with this endpoint
-    resource3 = await attack_resource_file_factory.create_async(
-        resource_type=AttackResourceType.EPHEMERAL_RULE_LIST,
-        file_name="noteditable.txt",
-        line_count=2,
-        byte_size=10,
-    )
     url3 = f"/api/v1/web/resources/{resource3.id}/content"
     resp3 = await authenticated_async_client.patch(url3, data={"content": "foo\nbar"})
     assert resp3.status_code == HTTPStatus.FORBIDDEN
@@ -115,3 +115,22 @@ def test_generate_brute_force_mask_and_charset_all_charsets() -> None:
     assert result["mask"] == "?1?1?1"
     # Should use tokens for all standard charsets
     assert result["custom_charset"] == "?1=?l?u?d?s?s"
+
+
+@pytest.mark.parametrize(
+    ("mask", "error_fragment"),
+    [
+        ("   ", "empty"),
+        ("?l" * 130, "maximum length"),
+        ("?l?z?d", "Invalid mask token"),
+    ],
+)
+def test_validate_mask_syntax_invalid(mask: str, error_fragment: str) -> None:
+    valid, error = AttackEstimationService.validate_mask_syntax(mask)
+    assert valid is False
+    assert error is not None
+    assert error_fragment in error
+
+
+def test_validate_mask_syntax_valid() -> None:
+    assert AttackEstimationService.validate_mask_syntax("?l?u?d?d?1A") == (True, None)
@@ -1,11 +1,21 @@
 """Test helper utilities for common patterns across the test suite."""
 
 import uuid
+from collections.abc import Sequence
+from typing import Any
 
+from polyfactory.factories.sqlalchemy_factory import SQLAlchemyFactory
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.services.user_service import generate_api_key
+from app.models.attack import Attack
+from app.models.campaign import Campaign
+from app.models.hash_list import HashList
 from app.models.project import ProjectUserAssociation, ProjectUserRole
+from tests.factories.attack_factory import AttackFactory
+from tests.factories.campaign_factory import CampaignFactory
+from tests.factories.hash_item_factory import HashItemFactory
+from tests.factories.hash_list_factory import HashListFactory
 from tests.factories.project_factory import ProjectFactory
 from tests.factories.user_factory import UserFactory
 
@@ -100,3 +110,112 @@ async def create_user_with_api_key_and_project_access(
     await db_session.commit()
 
     return user.id, project.id, api_key
+
+
+async def create_attack_stack(
+    db_session: AsyncSession,
+    project_id: int,
+    **attack_kwargs: Any,
+) -> tuple[HashList, Campaign, Attack]:
+    """
+    Create a hash list, a campaign on it, and an attack in that campaign.
+
+    The three rows are written in a single transaction instead of one
+    commit per factory call. The hash list is flushed first because
+    Attack.hash_list_id is a plain column with no relationship to resolve it.
+
+    Args:
+        db_session: The async database session
+        project_id: ID of the project that owns the hash list and campaign
+        **attack_kwargs: Field overrides passed to AttackFactory.build
+
+    Returns:
+        Tuple of (hash_list, campaign, attack)
+
+    Example:
+        hash_list, campaign, attack = await create_attack_stack(
+            db_session, project.id, name="ExportTest", attack_mode="dictionary"
+        )
+    """
+    hash_list = HashListFactory.build(project_id=project_id)
+    db_session.add(hash_list)
+    await db_session.flush()
+
+    campaign = CampaignFactory.build(project_id=project_id, hash_list_id=hash_list.id)
+    attack = AttackFactory.build(hash_list_id=hash_list.id, **attack_kwargs)
+    attack.campaign = campaign
+    db_session.add_all([campaign, attack])
+    await db_session.commit()
+
+    return hash_list, campaign, attack
+
+
+async def create_batch[T](
+    db_session: AsyncSession,
+    factory: type[SQLAlchemyFactory[T]],
+    rows: Sequence[dict[str, Any]],
+    **shared: Any,
+) -> list[T]:
+    """
+    Build one instance per row with ``factory`` and insert them in one commit.
+
+    ``add_all`` plus a single commit lets SQLAlchemy send one batched INSERT
+    instead of a round-trip and commit per ``create_async`` call.
+
+    Args:
+        db_session: The async database session
+        factory: The polyfactory SQLAlchemyFactory to build instances with
+        rows: Per-instance field overrides, one instance each
+        **shared: Field overrides applied to every instance; a row overrides them
+
+    Returns:
+        The created instances, in the order of ``rows``
+
+    Example:
+        await create_batch(
+            db_session,
+            CampaignFactory,
+            [{"name": "Alpha"}, {"name": "Beta"}],
+            project_id=project.id,
+            hash_list_id=hash_list.id,
+        )
+    """
+    instances = [factory.build(**{**shared, **row}) for row in rows]
+    db_session.add_all(instances)
+    await db_session.commit()
+    return instances
+
+
+async def create_hash_list_with_items(
+    db_session: AsyncSession,
+    items: Sequence[dict[str, Any]],
+    **hash_list_kwargs: Any,
+) -> HashList:
+    """
+    Create a hash list and its hash items in a single commit.
+
+    The items are linked through HashList.items, so the hash_list_items rows
+    are written by the same flush instead of one INSERT per item.
+
+    Args:
+        db_session: The async database session
+        items: Field overrides for each HashItem (e.g. hash, plain_text)
+        **hash_list_kwargs: Field overrides for the hash list
+            (project_id is required by HashListFactory)
+
+    Returns:
+        The created hash list
+
+    Example:
+        hash_list = await create_hash_list_with_items(
+            db_session,
+            [{"hash": "abc123", "plain_text": "password1"}],
+            project_id=project.id,
+        )
+    """
+    hash_list = HashListFactory.build(**hash_list_kwargs)
+    # Let the database assign the item IDs
+    hash_list.items = [HashItemFactory.build(id=None, **item) for item in items]
+    db_session.add(hash_list)
+    await db_session.commit()
+    return hash_list